@@ -0,0 +1,5 @@
+"""Shared tooling for running and timing the daily solutions.
+
+Every `day_N/dayN.py` exposes `parse(text)`, `part1(parsed)` and `part2(parsed)`.
+Use `python -m aoc run N` to solve a day from the command line.
+"""
@@ -0,0 +1,112 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .days import load_day, read_input
+from .runner import run_day
+
+# The caches of each worker process, set by `_initialize_worker`.
+_worker_caches = (None, None)
+
+
+def collect_inputs(paths=(), manifest=None):
+    """List the input files to solve.
+
+    Args:
+        paths (list): Input files, or directories whose files are all inputs.
+        manifest (str, optional): A file listing one input path per line. Relative
+            paths are relative to the manifest, and blank lines and lines starting
+            with "#" are skipped.
+
+    Returns:
+        list: The input paths, in the order given (directories sorted by name).
+    """
+    inputs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            inputs.extend(sorted(child for child in path.iterdir() if child.is_file()))
+        else:
+            inputs.append(path)
+    if manifest is not None:
+        manifest = Path(manifest)
+        with open(manifest, "r") as manifest_file:
+            for line in manifest_file:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    inputs.append(manifest.parent / line)
+    return inputs
+
+
+def solve_input(day, path, parse_cache=None, result_cache=None):
+    """Solve one input file and return a JSON-serializable record of the answers
+    and timings, or of the error if the input could not be solved.
+    """
+    record = {"day": day, "input": str(path)}
+    try:
+        text = read_input(day, path)
+        result = run_day(day, text, parse_cache, result_cache=result_cache)
+    except Exception as error:
+        record["error"] = f"{type(error).__name__}: {error}"
+        return record
+    record["answers"] = result.answers
+    record["timings"] = result.timings
+    if result.cached_parts:
+        record["cached"] = result.cached_parts
+    return record
+
+
+def _initialize_worker(day, parse_cache, result_cache):
+    global _worker_caches
+    # Import the day (and build its module-level tables) once per worker rather
+    # than once per input.
+    load_day(day)
+    _worker_caches = (parse_cache, result_cache)
+
+
+def _solve_in_worker(day, path):
+    return solve_input(day, path, *_worker_caches)
+
+
+def run_batch(day, paths, max_workers=None, parse_cache=None, result_cache=None):
+    """Solve every input in `paths` for `day`, reusing each process's imported
+    module and everything it caches between inputs.
+
+    Args:
+        day (int): The day to solve.
+        paths (list): The input files.
+        max_workers (int, optional): Fan the inputs out across this many worker
+            processes. By default they are solved one after another in this
+            process.
+        parse_cache (ParsedInputCache, optional): See `run_day`.
+        result_cache (ResultCache, optional): See `run_day`.
+
+    Yields:
+        dict: A record from `solve_input` for each input, in the order of `paths`.
+    """
+    if not max_workers:
+        load_day(day)
+        for path in paths:
+            yield solve_input(day, path, parse_cache, result_cache)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(day, parse_cache, result_cache),
+    ) as executor:
+        # Send the inputs in chunks so the workers are not idle waiting for the next
+        # path while the results are sent back.
+        chunksize = max(1, len(paths) // (max_workers * 4))
+        yield from executor.map(
+            _solve_in_worker, [day] * len(paths), paths, chunksize=chunksize
+        )
+
+
+def _to_json(value):
+    # NumPy scalars have `item` to convert them to the equivalent Python number.
+    # Anything else JSON does not know is written as a string.
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def format_record(record):
+    return json.dumps(record, default=_to_json)
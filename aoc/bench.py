@@ -0,0 +1,116 @@
+import math
+import multiprocessing
+
+from .generators import generate
+from .memory import format_bytes
+from .runner import PARTS, run_day
+
+# Each scale multiplies the size of the real puzzle input (see `generators.py`).
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+
+def _measure_in_child(day, scale, seed, connection):
+    result = run_day(day, generate(day, scale, seed), memory="rss")
+    peak_rss = max(
+        (usage.peak_rss for usage in result.memory.values() if usage.peak_rss),
+        default=None,
+    )
+    connection.send((result.timings, peak_rss))
+    connection.close()
+
+
+def measure(day, scale, seed=0, timeout=60.0):
+    """Solve a generated input for `day` at `scale` in a child process.
+
+    The child process is killed if it does not finish within `timeout` seconds
+    (including the time spent generating the input), so a single algorithmic cliff
+    cannot stall the whole benchmark.
+
+    Returns:
+        tuple or None: The timings from `run_day` and the peak RSS in bytes of the
+        parse and parts (`None` if the platform cannot report it), or `None` if the
+        run timed out or crashed.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_measure_in_child, args=(day, scale, seed, sender), daemon=True
+    )
+    process.start()
+    # Close our copy of the sending end so `recv` fails if the child crashes.
+    sender.close()
+    measurement = None
+    try:
+        if receiver.poll(timeout):
+            measurement = receiver.recv()
+    except EOFError:
+        pass
+    finally:
+        process.terminate()
+        process.join()
+        receiver.close()
+    return measurement
+
+
+def scaling_exponent(scales, seconds):
+    """Fit `seconds = c * scale**k` with least squares on a log-log scale and return
+    the exponent `k`. An exponent near 1 means linear scaling, near 2 quadratic, etc.
+    Returns `None` if there are fewer than two measurements.
+    """
+    if len(scales) < 2:
+        return None
+    xs = [math.log(scale) for scale in scales]
+    # Clamp very fast timings so the logarithm is defined.
+    ys = [math.log(max(second, 1e-7)) for second in seconds]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def bench_day(day, scales=DEFAULT_SCALES, seed=0, timeout=60.0, report=print):
+    """Measure `day` at increasing `scales`, stopping at the first scale that times
+    out since every larger scale would time out too.
+
+    Memory is tracked like time: the peak RSS of each scale is reported with its
+    own scaling exponent. It includes the interpreter and the generated input, so
+    the exponent is only meaningful once the solver's memory dominates.
+
+    Returns:
+        list: `(scale, timings, peak_rss)` tuples for the scales that finished.
+    """
+    stages = ["parse"] + list(PARTS)
+    report(f"Day {day}")
+    report(
+        f"  {'scale':>8}"
+        + "".join(f"{stage:>12}" for stage in stages)
+        + f"{'peak RSS':>12}"
+    )
+    measurements = []
+    for scale in scales:
+        measurement = measure(day, scale, seed, timeout)
+        if measurement is None:
+            report(f"  {scale:>8}  timed out after {timeout:g}s (or crashed)")
+            break
+        timings, peak_rss = measurement
+        measurements.append((scale, timings, peak_rss))
+        report(
+            f"  {scale:>8}"
+            + "".join(
+                f"{timings[stage]:>11.4f}s" if stage in timings else f"{'-':>12}"
+                for stage in stages
+            )
+            + f"{format_bytes(peak_rss):>12}"
+        )
+
+    series = [
+        [(scale, t[stage]) for scale, t, _ in measurements if stage in t]
+        for stage in stages
+    ]
+    series.append([(scale, rss) for scale, _, rss in measurements if rss])
+    exponents = []
+    for finished in series:
+        exponent = scaling_exponent(*zip(*finished)) if len(finished) > 1 else None
+        exponents.append(f"{exponent:>12.2f}" if exponent is not None else f"{'-':>12}")
+    report(f"  {'exponent':>8}" + "".join(exponents))
+    return measurements
@@ -0,0 +1,134 @@
+import hashlib
+import os
+import pickle
+
+from .days import STATE_DIR, source_hash
+
+# Parsed puzzle inputs, keyed by the day, the hash of the input text and the hash of
+# the day's source code (which stands in for the parser version).
+PARSED_CACHE_DIR = STATE_DIR / "parsed"
+PARSED_CACHE_MAX_BYTES = 256 * 2**20
+
+# The answer to each part, keyed by the day, the part, the hash of the input text and
+# the hash of the day's source code.
+RESULT_CACHE_DIR = STATE_DIR / "results"
+RESULT_CACHE_MAX_BYTES = 16 * 2**20
+
+# Returned by `DiskCache.get` when the key is not cached, since `None` can be a value.
+MISSING = object()
+
+
+class DiskCache:
+    """A directory of pickled values that evicts the least recently used files once
+    their total size exceeds `max_bytes`.
+
+    The modification time of each file records when it was last used, so reading a
+    value touches its file.
+
+    Args:
+        directory (Path): Where the values are stored. Created on the first `put`.
+        max_bytes (int): The total size the cached files are trimmed to.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return self.directory / f"{key}{self.suffix}"
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path, "rb") as cached:
+                value = pickle.load(cached)
+        except FileNotFoundError:
+            return MISSING
+        except Exception:
+            # A partially written or outdated file. Drop it and treat it as a miss.
+            path.unlink(missing_ok=True)
+            return MISSING
+        os.utime(path)
+        return value
+
+    def put(self, key, value):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        # Write to a temporary file first so concurrent readers (such as the workers
+        # of `python -m aoc all`) never see a partially written value.
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as cached:
+            pickle.dump(value, cached, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used files until the cache fits in `max_bytes`."""
+        entries = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Evicted by another process in the meantime.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def clear(self):
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+
+def input_hash(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ParsedInputCache(DiskCache):
+    """Caches the result of each day's `parse` so repeated runs on the same input
+    skip parsing. Editing a day's solution (or the shared modules it uses) changes
+    the key, so stale parsed inputs are never returned.
+    """
+
+    def __init__(self, directory=PARSED_CACHE_DIR, max_bytes=PARSED_CACHE_MAX_BYTES):
+        super().__init__(directory, max_bytes)
+
+    def parse(self, day, module, text):
+        """Return `module.parse(text)`, loading it from the cache when possible.
+
+        Returns:
+            tuple: The parsed input and whether it came from the cache.
+        """
+        key = f"day{day}-{input_hash(text)[:32]}-{source_hash(day)[:16]}"
+        parsed = self.get(key)
+        if parsed is not MISSING:
+            return parsed, True
+        parsed = module.parse(text)
+        self.put(key, parsed)
+        return parsed, False
+
+
+class ResultCache(DiskCache):
+    """Caches the answer to each part so re-running an unchanged day on an unchanged
+    input returns immediately. Editing the day's solution (or the shared modules it
+    uses) changes the key, so the answer is then computed again.
+    """
+
+    def __init__(self, directory=RESULT_CACHE_DIR, max_bytes=RESULT_CACHE_MAX_BYTES):
+        super().__init__(directory, max_bytes)
+
+    def key(self, day, part, text):
+        return f"day{day}-{part}-{input_hash(text)[:32]}-{source_hash(day)[:16]}"
+
+    def get_answer(self, day, part, text):
+        """Return the cached answer to `part` of `day` for `text`, or `MISSING`."""
+        return self.get(self.key(day, part, text))
+
+    def put_answer(self, day, part, text, answer):
+        self.put(self.key(day, part, text), answer)
@@ -0,0 +1,35 @@
+import os
+
+
+def byte_ranges(path, chunk_size):
+    """Split the file at `path` into consecutive byte ranges of `chunk_size` bytes.
+
+    Returns:
+        tuple: The start of each range and the (exclusive) end of each range. There
+        is always at least one range, even for an empty file.
+    """
+    size = os.path.getsize(path)
+    starts = range(0, max(size, 1), chunk_size)
+    ends = [min(start + chunk_size, size) for start in starts]
+    return starts, ends
+
+
+def read_range(path, start, end):
+    """Return the bytes of the lines of `path` that start in the byte range
+    `[start, end)`.
+
+    A line that crosses `end` is read to its end, and a line that crosses `start`
+    is left to the previous range, so reading every range from `byte_ranges` reads
+    every line exactly once. Each range can be read by a different process.
+    """
+    with open(path, "rb") as file:
+        if start:
+            # Skip the line that started before `start`. The previous range has it.
+            file.seek(start - 1)
+            file.readline()
+        position = file.tell()
+        data = file.read(max(end - position, 0))
+        if data and not data.endswith(b"\n"):
+            # Finish the last line, which started before `end`.
+            data += file.readline()
+    return data
@@ -0,0 +1,258 @@
+import argparse
+
+from .batch import collect_inputs, format_record, run_batch
+from .bench import DEFAULT_SCALES, bench_day
+from .cache import RESULT_CACHE_MAX_BYTES, ParsedInputCache, ResultCache
+from .days import available_days, load_day, read_input
+from .generators import generate
+from .pool import format_table, run_days
+from .profiling import (
+    DEFAULT_INTERVAL,
+    PROFILE_DIR,
+    CallProfiler,
+    SamplingProfiler,
+    default_functions,
+    format_profile,
+    write_profile,
+)
+from .runner import format_result, run_day
+from .startup import startup_table
+
+
+def caches(args, solve=False):
+    """Return the parsed-input and result caches selected by `args`. With `solve`,
+    the result cache is skipped so the parts really run.
+    """
+    if args.no_cache:
+        return None, None
+    result_cache = None
+    if not (solve or args.no_result_cache):
+        result_cache = ResultCache(max_bytes=int(args.result_cache_size * 2**20))
+    return ParsedInputCache(), result_cache
+
+
+def run_command(args):
+    text = read_input(args.day, args.input)
+    memory = "trace" if args.memory else None
+    # Measuring memory or profiling needs the parts to actually run.
+    parse_cache, result_cache = caches(args, solve=args.memory or args.profile)
+    if not args.profile:
+        result = run_day(args.day, text, parse_cache, memory, result_cache)
+        print(format_result(result))
+        return
+
+    module = load_day(args.day)
+    if args.profile == "sampling":
+        profiler = SamplingProfiler(module, args.sample_interval)
+    else:
+        functions = args.profile_functions or default_functions(args.day, module)
+        profiler = CallProfiler(module, functions)
+    with profiler:
+        result = run_day(args.day, text, parse_cache, memory)
+    print(format_result(result))
+    report = profiler.report()
+    print(f"Profile ({report['mode']})")
+    print(format_profile(report))
+    prefix = args.profile_output or PROFILE_DIR / f"day{args.day}"
+    for path in write_profile(profiler, prefix):
+        print(f"Wrote {path}")
+
+
+def all_command(args):
+    days = args.days or available_days()
+    print(format_table(*run_days(days, args.workers, *caches(args))))
+
+
+def batch_command(args):
+    paths = collect_inputs(args.inputs, args.manifest)
+    if not paths:
+        raise SystemExit("No input files given")
+    records = run_batch(args.day, paths, args.workers, *caches(args))
+    for record in records:
+        print(format_record(record), flush=True)
+
+
+def generate_command(args):
+    text = generate(args.day, args.scale, args.seed)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+def bench_command(args):
+    for day in args.days or available_days():
+        bench_day(day, args.scales, args.seed, args.timeout)
+
+
+def add_cache_arguments(parser):
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the input and solve each part from scratch instead of using the "
+        "parsed-input cache in .aoc/parsed and the result cache in .aoc/results.",
+    )
+    parser.add_argument(
+        "--no-result-cache",
+        action="store_true",
+        help="Solve each part from scratch, but still use the parsed-input cache.",
+    )
+    parser.add_argument(
+        "--result-cache-size",
+        type=float,
+        default=RESULT_CACHE_MAX_BYTES / 2**20,
+        metavar="MB",
+        help="Evict the least recently used answers once the result cache is "
+        f"larger than this (default: {RESULT_CACHE_MAX_BYTES // 2**20} MB).",
+    )
+
+
+def startup_command(args):
+    print(startup_table(args.days or available_days(), repeat=args.repeat))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc", description="Run the Advent of Code 2021 solutions."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Solve a single day and time the parse and each part."
+    )
+    run_parser.add_argument("day", type=int, help="The day to solve (1-25).")
+    run_parser.add_argument(
+        "--input", help="Path to the puzzle input (default: day_N/puzzle_input.txt)."
+    )
+    add_cache_arguments(run_parser)
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Report the peak RSS and the largest allocation sites (with "
+        "tracemalloc) of the parse and each part. Slows the timings down.",
+    )
+    run_parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="calls",
+        choices=["calls", "sampling"],
+        help="Profile the run. 'calls' (the default) counts the calls to and time "
+        "spent in the day's hot functions; 'sampling' periodically records the whole "
+        "call stack. Writes JSON and a collapsed-stack file for flame graphs.",
+    )
+    run_parser.add_argument(
+        "--profile-functions",
+        nargs="+",
+        metavar="NAME",
+        help="Functions to instrument in 'calls' mode (default: the day's known hot "
+        "functions, or all of its functions).",
+    )
+    run_parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=DEFAULT_INTERVAL,
+        help=f"Seconds between samples in 'sampling' mode (default: {DEFAULT_INTERVAL}).",
+    )
+    run_parser.add_argument(
+        "--profile-output",
+        metavar="PREFIX",
+        help="Write PREFIX.json and PREFIX.collapsed (default: .aoc/profile/dayN).",
+    )
+    run_parser.set_defaults(handler=run_command)
+
+    all_parser = subparsers.add_parser(
+        "all",
+        help="Solve every day (or the given days) concurrently in a process pool, "
+        "starting the slowest days first.",
+    )
+    all_parser.add_argument(
+        "days", type=int, nargs="*", help="Days to solve (default: all)."
+    )
+    all_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes (default: the number of CPUs).",
+    )
+    add_cache_arguments(all_parser)
+    all_parser.set_defaults(handler=all_command)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Solve many inputs for one day in a single warm process and print a "
+        "JSON line of answers and timings per input.",
+    )
+    batch_parser.add_argument("day", type=int, help="The day to solve (1-25).")
+    batch_parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Input files, or directories whose files are all inputs.",
+    )
+    batch_parser.add_argument(
+        "--manifest", help="A file listing one input path per line."
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Spread the inputs across this many worker processes (default: solve "
+        "them one after another in this process).",
+    )
+    add_cache_arguments(batch_parser)
+    batch_parser.set_defaults(handler=batch_command)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Print a synthetic puzzle input for a day."
+    )
+    generate_parser.add_argument("day", type=int, help="The day to generate for.")
+    generate_parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="How many times larger than the real puzzle input (default: 1).",
+    )
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("--output", help="Write to a file instead of stdout.")
+    generate_parser.set_defaults(handler=generate_command)
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Time each day on generated inputs of increasing size and report the "
+        "empirical scaling exponent.",
+    )
+    bench_parser.add_argument(
+        "days", type=int, nargs="*", help="Days to benchmark (default: all)."
+    )
+    bench_parser.add_argument(
+        "--scales", type=int, nargs="+", default=list(DEFAULT_SCALES)
+    )
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="Seconds allowed per day and scale before larger scales are skipped.",
+    )
+    bench_parser.set_defaults(handler=bench_command)
+
+    startup_parser = subparsers.add_parser(
+        "startup",
+        help="Time starting a fresh interpreter and importing each day's module "
+        "with `python -X importtime`.",
+    )
+    startup_parser.add_argument(
+        "days", type=int, nargs="*", help="Days to measure (default: all)."
+    )
+    startup_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per day; the fastest is reported (default: 3).",
+    )
+    startup_parser.set_defaults(handler=startup_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
@@ -0,0 +1,69 @@
+import hashlib
+import importlib.util
+from pathlib import Path
+
+# The repository root, which holds one `day_N` directory per puzzle.
+ROOT = Path(__file__).resolve().parent.parent
+# Recorded timings and other generated state live here (ignored by git).
+STATE_DIR = ROOT / ".aoc"
+
+# Shared modules that the day solutions import. A change to any of these changes the
+# `source_hash` of every day.
+SHARED_SOURCES = [ROOT / "aoc" / "chunks.py", ROOT / "aoc" / "grid.py"]
+
+# Day modules that have already been imported, keyed by day number.
+_loaded_days = {}
+
+
+def solver_path(day):
+    return ROOT / f"day_{day}" / f"day{day}.py"
+
+
+def input_path(day):
+    return ROOT / f"day_{day}" / "puzzle_input.txt"
+
+
+def available_days():
+    """Return the days that have a Python solution. Day 24 was solved by hand (see
+    `day_24/day24.md`) so it is not included.
+    """
+    return [day for day in range(1, 26) if solver_path(day).exists()]
+
+
+def load_day(day):
+    """Import the solution module for `day` from its `day_N` directory.
+
+    The `day_N` directories are not packages, so the module is loaded directly from
+    its file path. Modules are only imported once per process.
+
+    Args:
+        day (int): The day number (1-25).
+
+    Returns:
+        module: The module exposing `parse`, `part1` and (except day 25) `part2`.
+    """
+    if day not in _loaded_days:
+        path = solver_path(day)
+        if not path.exists():
+            raise ValueError(f"Day {day} does not have a Python solution")
+        spec = importlib.util.spec_from_file_location(f"day{day}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _loaded_days[day] = module
+    return _loaded_days[day]
+
+
+def source_hash(day):
+    """Return a hash of the source code of `day`'s solution and the shared modules it
+    can use, so anything derived from the solution can be invalidated when it changes.
+    """
+    digest = hashlib.sha256()
+    for path in [solver_path(day)] + SHARED_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def read_input(day, path=None):
+    """Read the puzzle input at `path`, defaulting to `day_N/puzzle_input.txt`."""
+    with open(path or input_path(day), "r") as puzzle_input:
+        return puzzle_input.read()
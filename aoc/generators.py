@@ -0,0 +1,567 @@
+"""Synthetic puzzle input generators.
+
+Each generator takes a `random.Random` instance and a `scale` and returns puzzle input
+text that the matching `day_N/dayN.py` can solve. A `scale` of 1 produces an input of
+roughly the same size as the real puzzle input. Larger scales multiply the natural
+size of the input (number of lines, boards, scanners, cuboids, or grid cells), so a
+grid at scale 100 has 100 times as many cells, not 100 times the side length.
+"""
+
+import math
+import random
+from itertools import combinations
+
+# Rotation matrices built exactly the same way as `rotations()` in `day_19/day19.py`.
+_unit_vectors = [(1, 0, 0), (-1, 0, 0), (0, 1, 0), (0, -1, 0), (0, 0, 1), (0, 0, -1)]
+
+
+def _cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+ROTATIONS = [
+    (vi, vj, _cross(vi, vj))
+    for vi in _unit_vectors
+    for vj in _unit_vectors
+    if sum(a * b for a, b in zip(vi, vj)) == 0
+]
+
+
+def _grid_side(base_side, scale):
+    # Grow the side length with the square root of the scale so the number of cells
+    # grows linearly with the scale.
+    return max(1, round(base_side * math.sqrt(scale)))
+
+
+def _digit_grid(rng, height, width, digits="0123456789"):
+    return "\n".join("".join(rng.choices(digits, k=width)) for _ in range(height))
+
+
+def day1(rng, scale):
+    # A random walk of sonar depths that never goes above the surface.
+    depth = rng.randint(100, 200)
+    depths = []
+    for _ in range(2000 * scale):
+        depth = max(1, depth + rng.randint(-10, 20))
+        depths.append(depth)
+    return "\n".join(map(str, depths))
+
+
+def day2(rng, scale):
+    commands = rng.choices(("forward", "down", "up"), weights=(4, 4, 2), k=1000 * scale)
+    return "\n".join(f"{command} {rng.randint(1, 9)}" for command in commands)
+
+
+def day3(rng, scale, width=12):
+    return "\n".join(
+        format(rng.getrandbits(width), f"0{width}b") for _ in range(1000 * scale)
+    )
+
+
+def day4(rng, scale):
+    numbers = list(range(100))
+    draw_order = numbers.copy()
+    rng.shuffle(draw_order)
+    draw_index = {number: idx for idx, number in enumerate(draw_order)}
+
+    boards = []
+    win_times = []
+    for _ in range(100 * scale):
+        board = rng.sample(numbers, 25)
+        rows = [board[idx : idx + 5] for idx in range(0, 25, 5)]
+        # A board wins on the draw that completes its first row or column.
+        win_times.append(
+            min(
+                max(draw_index[number] for number in line)
+                for line in rows + list(map(list, zip(*rows)))
+            )
+        )
+        boards.append(rows)
+
+    # Part 2 needs a single board that wins last, so drop any other boards that tie
+    # with it.
+    last_win_time = max(win_times)
+    last_winner = win_times.index(last_win_time)
+    boards = [
+        board
+        for idx, board in enumerate(boards)
+        if win_times[idx] != last_win_time or idx == last_winner
+    ]
+
+    board_texts = [
+        "\n".join(" ".join(f"{number:>2}" for number in row) for row in board)
+        for board in boards
+    ]
+    return ",".join(map(str, draw_order)) + "\n\n" + "\n\n".join(board_texts)
+
+
+def day5(rng, scale, extent=1000):
+    lines = []
+    for _ in range(500 * scale):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        # Lines are always horizontal, vertical, or at exactly 45 degrees.
+        dx, dy = rng.choice(
+            [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+        )
+        max_length = min(
+            extent - 1 - x1 if dx > 0 else x1 if dx < 0 else extent,
+            extent - 1 - y1 if dy > 0 else y1 if dy < 0 else extent,
+        )
+        length = rng.randint(0, max_length)
+        lines.append(f"{x1},{y1} -> {x1 + dx * length},{y1 + dy * length}")
+    return "\n".join(lines)
+
+
+def day6(rng, scale):
+    return ",".join(str(rng.randint(1, 5)) for _ in range(300 * scale))
+
+
+def day7(rng, scale):
+    # Both the number of crabs and the range of positions grow with the scale.
+    max_position = 2000 * scale
+    return ",".join(str(rng.randrange(max_position)) for _ in range(1000 * scale))
+
+
+# The segments lit for each digit on an unscrambled seven-segment display.
+SEVEN_SEGMENT_DIGITS = [
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+]
+
+
+def day8(rng, scale):
+    lines = []
+    for _ in range(200 * scale):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        scrambled = [
+            "".join(rng.sample([wiring[segment] for segment in digit], len(digit)))
+            for digit in SEVEN_SEGMENT_DIGITS
+        ]
+        patterns = rng.sample(scrambled, 10)
+        output = [
+            "".join(rng.sample(pattern, len(pattern)))
+            for pattern in rng.choices(scrambled, k=4)
+        ]
+        lines.append(" ".join(patterns) + " | " + " ".join(output))
+    return "\n".join(lines)
+
+
+def day9(rng, scale):
+    side = _grid_side(100, scale)
+
+    def wall_positions():
+        # Rows/columns of 9s placed between 3 and 12 cells apart.
+        positions = []
+        position = rng.randint(2, 12)
+        while position < side:
+            positions.append(position)
+            position += rng.randint(3, 12)
+        return positions
+
+    def spans(walls):
+        starts = [0] + [wall + 1 for wall in walls]
+        ends = walls + [side]
+        return [(start, end) for start, end in zip(starts, ends) if start < end]
+
+    wall_rows, wall_cols = set(wall_positions()), set(wall_positions())
+    grid = [[9] * side for _ in range(side)]
+    # Every rectangle between the walls is a basin with exactly one low point. The
+    # height of every other cell is its distance from the low point (capped at 8),
+    # so each cell has a lower neighbor on the way back to the low point.
+    for row_start, row_end in spans(sorted(wall_rows)):
+        for col_start, col_end in spans(sorted(wall_cols)):
+            low_row = rng.randrange(row_start, row_end)
+            low_col = rng.randrange(col_start, col_end)
+            for row in range(row_start, row_end):
+                grid_row = grid[row]
+                row_distance = abs(row - low_row)
+                for col in range(col_start, col_end):
+                    grid_row[col] = min(8, row_distance + abs(col - low_col))
+    return "\n".join("".join(map(str, row)) for row in grid)
+
+
+def day10(rng, scale):
+    open_to_close_character = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    lines = []
+    num_incomplete = 0
+
+    def make_line(corrupt):
+        opening = rng.choice("([{<")
+        stack = [opening]
+        characters = [opening]
+        for _ in range(rng.randint(80, 110)):
+            if stack and rng.random() < 0.45:
+                expected = open_to_close_character[stack.pop()]
+                characters.append(expected)
+            else:
+                opening = rng.choice("([{<")
+                stack.append(opening)
+                characters.append(opening)
+        if corrupt:
+            if not stack:
+                opening = rng.choice("([{<")
+                stack.append(opening)
+                characters.append(opening)
+            expected = open_to_close_character[stack[-1]]
+            characters.append(rng.choice([c for c in ")]}>" if c != expected]))
+            # Add some noise after the first illegal character.
+            characters.extend(rng.choices("()[]{}<>", k=rng.randint(0, 10)))
+        elif not stack:
+            # Make sure every non-corrupted line is incomplete.
+            characters.append(rng.choice("([{<"))
+        return "".join(characters)
+
+    for _ in range(100 * scale):
+        corrupt = rng.random() < 0.5
+        lines.append(make_line(corrupt))
+        num_incomplete += not corrupt
+    # The part 2 answer is the middle score, so there must be an odd number of
+    # incomplete lines.
+    if num_incomplete % 2 == 0:
+        lines.append(make_line(corrupt=False))
+    return "\n".join(lines)
+
+
+def day11(rng, scale):
+    # Random grids with the full 0-9 range of energy levels often never synchronize
+    # once they are larger than 10x10. Starting every octopus at a low energy level
+    # still needs several rounds of cascading flashes, but reliably synchronizes so
+    # part 2 terminates.
+    side = _grid_side(10, scale)
+    return _digit_grid(rng, side, side, digits="0123")
+
+
+def day12(rng, scale):
+    # The number of paths grows exponentially with the number of caves, so the cave
+    # count only grows with the logarithm of the scale.
+    num_small = 6 + round(2 * math.log10(scale))
+    num_big = 2 + round(math.log10(scale))
+    small_caves = ["start", "end"] + [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=2)) + str(idx)
+        for idx in range(num_small)
+    ]
+    big_caves = [
+        "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=2)) + str(idx)
+        for idx in range(num_big)
+    ]
+    edges = set()
+    # Connect each big cave to several small caves. Big caves are never connected to
+    # each other, otherwise there would be infinitely many paths.
+    for big_cave in big_caves:
+        for small_cave in rng.sample(small_caves, min(len(small_caves), 4)):
+            edges.add((big_cave, small_cave))
+    # Guarantee at least one path from "start" to "end".
+    edges.update(
+        [
+            (big_caves[0], "start"),
+            (big_caves[0], small_caves[2]),
+            (big_caves[1], small_caves[2]),
+            (big_caves[1], "end"),
+        ]
+    )
+    for cave_a, cave_b in combinations(small_caves, 2):
+        if {cave_a, cave_b} != {"start", "end"} and rng.random() < 0.15:
+            edges.add((cave_a, cave_b))
+    return "\n".join(f"{cave_a}-{cave_b}" for cave_a, cave_b in sorted(edges))
+
+
+def day13(rng, scale):
+    # Start from the size of the final code and unfold it along alternating axes.
+    # Every fold is at the exact middle of the paper, like the real input.
+    width, height = 39, 6
+    folds = []
+    num_folds = 6 + round(math.log2(scale) / 2)
+    for _ in range(num_folds):
+        folds.append(("x", width))
+        width = 2 * width + 1
+        folds.append(("y", height))
+        height = 2 * height + 1
+    folds.reverse()
+
+    fold_xs = {position for axis, position in folds if axis == "x"}
+    fold_ys = {position for axis, position in folds if axis == "y"}
+    dots = set()
+    while len(dots) < 800 * scale:
+        x, y = rng.randrange(width), rng.randrange(height)
+        # Dots never appear on a fold line.
+        if x in fold_xs or y in fold_ys:
+            continue
+        dots.add((x, y))
+    return (
+        "\n".join(f"{x},{y}" for x, y in dots)
+        + "\n\n"
+        + "\n".join(f"fold along {axis}={position}" for axis, position in folds)
+    )
+
+
+def day14(rng, scale):
+    elements = "BCFHKNOPSV"
+    template = "".join(rng.choices(elements, k=20 * scale))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    return template + "\n\n" + "\n".join(rules)
+
+
+def day15(rng, scale):
+    side = _grid_side(100, scale)
+    return _digit_grid(rng, side, side, digits="123456789")
+
+
+def _encode_packet(rng, num_packets, depth, type_ids=(0, 1, 2, 3, 5, 6, 7)):
+    """Return the binary string of a random packet containing about `num_packets`
+    packets in total, nested at most `depth` levels deep.
+    """
+    version = format(rng.randrange(8), "03b")
+    if num_packets <= 1 or depth == 0:
+        # Literal value packet made of 1 to 4 groups of 4 bits.
+        groups = [format(rng.randrange(16), "04b") for _ in range(rng.randint(1, 4))]
+        return (
+            version
+            + "100"
+            + "".join("1" + group for group in groups[:-1])
+            + "0"
+            + groups[-1]
+        )
+
+    type_id = rng.choice(type_ids)
+    if type_id >= 5:
+        # Comparison packets always have exactly two sub-packets.
+        num_subpackets = 2
+    else:
+        num_subpackets = rng.randint(2, min(num_packets, 2047, 8 + num_packets // 16))
+    child_budget = (num_packets - 1) // num_subpackets
+    subpackets = "".join(
+        _encode_packet(rng, child_budget, depth - 1) for _ in range(num_subpackets)
+    )
+    if len(subpackets) < 2**15 and rng.random() < 0.5:
+        header = "0" + format(len(subpackets), "015b")
+    else:
+        header = "1" + format(num_subpackets, "011b")
+    return version + format(type_id, "03b") + header + subpackets
+
+
+def day16(rng, scale):
+    # The outermost packet is a sum so the part 2 answer is a number.
+    bits = _encode_packet(rng, 100 * scale, depth=12, type_ids=(0,))
+    # Pad with zeros to a whole number of hexadecimal digits.
+    bits += "0" * (-len(bits) % 4)
+    return "".join(
+        format(int(bits[idx : idx + 4], 2), "X") for idx in range(0, len(bits), 4)
+    )
+
+
+def day17(rng, scale):
+    # The part 2 search space is proportional to the area spanned by the target.
+    factor = math.sqrt(scale)
+    x1 = round(rng.randint(100, 150) * factor)
+    x2 = x1 + round(rng.randint(30, 50) * factor)
+    y1 = -round(rng.randint(120, 150) * factor)
+    y2 = y1 + round(rng.randint(30, 50) * factor)
+    return f"target area: x={x1}..{x2}, y={y1}..{y2}"
+
+
+def _snailfish_number(rng, depth=0):
+    # Reduced snailfish numbers are nested at most 4 pairs deep and only contain
+    # regular numbers below 10.
+    if depth > 0 and (depth == 4 or rng.random() < 0.3):
+        return str(rng.randint(0, 9))
+    return f"[{_snailfish_number(rng, depth + 1)},{_snailfish_number(rng, depth + 1)}]"
+
+
+def day18(rng, scale):
+    return "\n".join(_snailfish_number(rng) for _ in range(100 * scale))
+
+
+def day19(rng, scale):
+    # Scanners are placed in a chain 1100 units apart along the x axis, so each
+    # scanner only overlaps its direct neighbors. Every pair of neighbors shares
+    # exactly 12 beacons and every scanner also sees a few beacons that no other
+    # scanner can detect.
+    num_scanners = 30 * scale
+    spacing = 1100
+    positions = [
+        (idx * spacing, rng.randint(-50, 50), rng.randint(-50, 50))
+        for idx in range(num_scanners)
+    ]
+
+    def distance_key(a, b):
+        return tuple(sorted(abs(i - j) for i, j in zip(a, b)))
+
+    # `views[idx]` is the list of beacons scanner `idx` detects, and `view_keys[idx]`
+    # is the set of beacon distances in that view. `day19.py` uses these distances to
+    # match scanners, so every distance within a view must be unique.
+    views = [[] for _ in range(num_scanners)]
+    view_keys = [set() for _ in range(num_scanners)]
+
+    def add_beacon(scanner_idxs, x_range):
+        while True:
+            beacon = (
+                rng.randint(*x_range),
+                rng.randint(
+                    max(positions[idx][1] for idx in scanner_idxs) - 1000,
+                    min(positions[idx][1] for idx in scanner_idxs) + 1000,
+                ),
+                rng.randint(
+                    max(positions[idx][2] for idx in scanner_idxs) - 1000,
+                    min(positions[idx][2] for idx in scanner_idxs) + 1000,
+                ),
+            )
+            new_keys = [
+                {distance_key(beacon, other) for other in views[idx]}
+                for idx in scanner_idxs
+            ]
+            if all(
+                len(keys) == len(views[idx]) and not keys & view_keys[idx]
+                for keys, idx in zip(new_keys, scanner_idxs)
+            ):
+                break
+        for keys, idx in zip(new_keys, scanner_idxs):
+            views[idx].append(beacon)
+            view_keys[idx] |= keys
+
+    for idx in range(num_scanners):
+        x = positions[idx][0]
+        # Beacons within 100 units of the scanner's x position are out of range of
+        # the neighboring scanners.
+        for _ in range(rng.randint(2, 8)):
+            add_beacon([idx], (x - 99, x + 99))
+        if idx + 1 < num_scanners:
+            for _ in range(12):
+                add_beacon([idx, idx + 1], (x + 101, x + 999))
+        # Only the current and next view are still needed.
+        view_keys[idx] = None
+
+    scanner_texts = []
+    for idx, (position, view) in enumerate(zip(positions, views)):
+        # Scanner 0 defines the coordinate system. Every other scanner reports its
+        # beacons relative to itself in one of the 24 orientations.
+        rotation = ROTATIONS[0] if idx == 0 else rng.choice(ROTATIONS)
+        rng.shuffle(view)
+        lines = [f"--- scanner {idx} ---"]
+        for beacon in view:
+            relative = [b - p for b, p in zip(beacon, position)]
+            # Invert the rotation the solver applies (`relative @ rotation`), which
+            # is a multiplication by the transpose.
+            reported = [sum(r * v for r, v in zip(relative, row)) for row in rotation]
+            lines.append(",".join(map(str, reported)))
+        scanner_texts.append("\n".join(lines))
+    return "\n\n".join(scanner_texts)
+
+
+def day20(rng, scale):
+    # Like the real input, the first character of the algorithm is "#" and the last
+    # is "." so the infinite background flips between dark and lit each step.
+    algorithm = ["#"] + rng.choices("#.", k=510) + ["."]
+    side = _grid_side(100, scale)
+    return "".join(algorithm) + "\n\n" + _digit_grid(rng, side, side, digits="#.")
+
+
+def day21(rng, scale):
+    # The game is the same size no matter the scale.
+    return (
+        f"Player 1 starting position: {rng.randint(1, 10)}\n"
+        f"Player 2 starting position: {rng.randint(1, 10)}"
+    )
+
+
+def _cuboid(rng, center_range, size_range):
+    ranges = []
+    for _ in range(3):
+        start = rng.randint(*center_range)
+        ranges.append((start, start + rng.randint(*size_range)))
+    return "x={}..{},y={}..{},z={}..{}".format(*[v for r in ranges for v in r])
+
+
+def day22(rng, scale):
+    # The first 20 steps are in the -50..50 initialization region, as in the real
+    # input, followed by larger cuboids across the whole reactor.
+    steps = [
+        f"{'on' if idx < 10 or rng.random() < 0.6 else 'off'} "
+        + _cuboid(rng, (-50, 0), (10, 50))
+        for idx in range(20)
+    ]
+    steps += [
+        f"{'on' if rng.random() < 0.6 else 'off'} "
+        + _cuboid(rng, (-95000, 75000), (5000, 30000))
+        for _ in range(400 * scale)
+    ]
+    return "\n".join(steps)
+
+
+def day23(rng, scale):
+    # The burrow is the same size no matter the scale.
+    amphipods = list("AABBCCDD")
+    rng.shuffle(amphipods)
+    return "\n".join(
+        [
+            "#############",
+            "#...........#",
+            "###{}#{}#{}#{}###".format(*amphipods[:4]),
+            "  #{}#{}#{}#{}#".format(*amphipods[4:]),
+            "  #########",
+        ]
+    )
+
+
+def day25(rng, scale):
+    height = _grid_side(137, scale)
+    width = _grid_side(139, scale)
+    # Use the same density of each sea cucumber herd as the real input.
+    return "\n".join(
+        "".join(rng.choices(">v.", weights=(1, 1, 2), k=width)) for _ in range(height)
+    )
+
+
+GENERATORS = {
+    1: day1,
+    2: day2,
+    3: day3,
+    4: day4,
+    5: day5,
+    6: day6,
+    7: day7,
+    8: day8,
+    9: day9,
+    10: day10,
+    11: day11,
+    12: day12,
+    13: day13,
+    14: day14,
+    15: day15,
+    16: day16,
+    17: day17,
+    18: day18,
+    19: day19,
+    20: day20,
+    21: day21,
+    22: day22,
+    23: day23,
+    25: day25,
+}
+
+
+def generate(day, scale=1, seed=0):
+    """Generate a synthetic input for `day`.
+
+    Args:
+        day (int): The day to generate an input for.
+        scale (int): How many times larger than the real puzzle input to make it.
+        seed (int): Seed for the random number generator, so inputs are reproducible.
+
+    Returns:
+        str: The generated puzzle input text.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"Day {day} does not have an input generator")
+    return GENERATORS[day](random.Random(seed), scale)
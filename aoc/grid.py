@@ -0,0 +1,116 @@
+from array import array
+
+# Translation table that turns the ASCII digits "0"-"9" into the bytes 0-9.
+_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# Neighbor directions as `(dx, dy)`. The first four are not diagonal.
+DIRECTIONS4 = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+DIRECTIONS8 = DIRECTIONS4 + [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class Grid:
+    """A rectangular grid stored row by row in a single flat `array`.
+
+    Cells are addressed by their flat index `y * width + x`, which avoids allocating
+    and hashing an `(x, y)` tuple for every lookup. With the default one byte per
+    cell, a grid with 10^7 cells only needs about 10 MB.
+
+    Args:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        cells (array, optional): The flat cell values. Defaults to all zeros.
+        typecode (str): The `array` typecode used when `cells` is not given. The
+            default, "b", holds the integers -128 to 127.
+    """
+
+    def __init__(self, width, height, cells=None, typecode="b"):
+        self.width = width
+        self.height = height
+        if cells is None:
+            cells = array(typecode, bytes(width * height * array(typecode).itemsize))
+        if len(cells) != width * height:
+            raise ValueError(
+                f"Expected {width * height} cells for a {width}x{height} grid but got "
+                f"{len(cells)}"
+            )
+        self.cells = cells
+        # Precompute the change in flat index for each neighbor direction, so finding
+        # a neighbor only needs one addition once its bounds are checked.
+        self.offsets4 = [(dx, dy, dy * width + dx) for dx, dy in DIRECTIONS4]
+        self.offsets8 = [(dx, dy, dy * width + dx) for dx, dy in DIRECTIONS8]
+
+    @classmethod
+    def from_digits(cls, text, typecode="b"):
+        """Parse lines of single digits, such as the day 9 heightmap."""
+        return cls.from_lines(text, typecode, translate=_DIGITS)
+
+    @classmethod
+    def from_lines(cls, text, typecode="B", translate=None):
+        """Parse lines of characters, storing each character's byte value (or the
+        value from the `translate` table).
+        """
+        lines = text.split()
+        cells = array(typecode)
+        for line in lines:
+            line = line.encode()
+            if translate is not None:
+                line = line.translate(translate)
+            if cells.itemsize == 1:
+                cells.frombytes(line)
+            else:
+                cells.extend(line)
+        return cls(len(lines[0]), len(lines), cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __setitem__(self, index, value):
+        self.cells[index] = value
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def coordinates(self, index):
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def row(self, y):
+        """Return a zero-copy view of row `y`. Writes to the view change the grid."""
+        start = y * self.width
+        return memoryview(self.cells)[start : start + self.width]
+
+    def rows(self):
+        view = memoryview(self.cells)
+        for start in range(0, len(self.cells), self.width):
+            yield view[start : start + self.width]
+
+    def neighbors(self, index, offsets):
+        """Yield the flat index of each neighbor of `index` in the directions given
+        by `offsets` (`self.offsets4` or `self.offsets8`) that is inside the grid.
+        """
+        y, x = divmod(index, self.width)
+        for dx, dy, offset in offsets:
+            if 0 <= x + dx < self.width and 0 <= y + dy < self.height:
+                yield index + offset
+
+    def neighbors4(self, index):
+        return self.neighbors(index, self.offsets4)
+
+    def neighbors8(self, index):
+        return self.neighbors(index, self.offsets8)
+
+    def copy(self):
+        return Grid(self.width, self.height, array(self.cells.typecode, self.cells))
+
+    def to_numpy(self):
+        """Return a zero-copy `(height, width)` NumPy view of the cells. Writes to
+        the view change the grid. NumPy is only imported when this is called.
+        """
+        import numpy as np
+
+        # `array` typecodes are also NumPy dtype characters ("b" is int8, etc.).
+        cells = np.frombuffer(self.cells, dtype=self.cells.typecode)
+        return cells.reshape(self.height, self.width)
@@ -0,0 +1,149 @@
+import sys
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where peak RSS is not reported.
+    resource = None
+
+# Writing "5" to this file resets the peak RSS of the process (Linux only).
+_CLEAR_REFS = "/proc/self/clear_refs"
+
+# How often the allocation tracer checks whether traced memory reached a new peak.
+_POLL_INTERVAL = 0.005
+
+# Frames inside these files are not useful allocation sites.
+_IGNORED_FILES = (
+    __file__,
+    tracemalloc.__file__,
+    threading.__file__,
+    "<frozen importlib.*>",
+)
+
+
+@dataclass
+class MemoryUsage:
+    # The peak resident set size in bytes, or `None` if the platform cannot report
+    # it. Unless `rss_reset` is set this is the peak of the whole process so far.
+    peak_rss: int = None
+    rss_reset: bool = False
+    # The peak of the memory allocated by Python while tracing, in bytes.
+    peak_traced: int = None
+    # The largest allocation sites near the traced peak, as `(site, bytes, count)`.
+    top_allocations: list = field(default_factory=list)
+
+
+def reset_peak_rss():
+    """Reset the peak RSS of this process to its current RSS, where the platform
+    allows it. Returns whether it was reset.
+    """
+    try:
+        with open(_CLEAR_REFS, "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss():
+    """Return the peak resident set size of this process in bytes, or `None`."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # `ru_maxrss` is in bytes on macOS but kilobytes everywhere else.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class _AllocationTracer:
+    """Trace Python allocations with `tracemalloc` and record the largest allocation
+    sites near the peak, rather than after the temporaries have been freed.
+
+    A background thread takes a snapshot whenever the traced memory grows well past
+    the last snapshot. Each snapshot is immediately reduced to its top `limit`
+    sites and the peak is reset afterwards, so the memory used by the snapshot
+    itself does not count towards `peak`.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.peak = 0
+        self.top_allocations = []
+        self._snapshot_size = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def __enter__(self):
+        tracemalloc.start()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        # Whatever is still allocated at the end (such as the parsed input) may be
+        # the peak too.
+        self._snapshot_if_larger()
+        tracemalloc.stop()
+
+    def _snapshot_if_larger(self):
+        size, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        if size > self._snapshot_size * 1.1:
+            self.top_allocations = top_allocations(
+                tracemalloc.take_snapshot(), self.limit
+            )
+            self._snapshot_size = size
+            tracemalloc.reset_peak()
+
+    def _poll(self):
+        while not self._stop.wait(_POLL_INTERVAL):
+            self._snapshot_if_larger()
+
+
+def top_allocations(snapshot, limit):
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+    )
+    return [
+        (
+            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            stat.size,
+            stat.count,
+        )
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+def measure_memory(function, *args, trace=False, limit=5):
+    """Call `function(*args)` and return its result and a `MemoryUsage`.
+
+    Args:
+        trace (bool): Also trace Python allocations with `tracemalloc`. This finds
+            the largest allocation sites but makes `function` several times slower.
+        limit (int): The number of allocation sites to report when tracing.
+    """
+    usage = MemoryUsage(rss_reset=reset_peak_rss())
+    if not trace:
+        result = function(*args)
+        usage.peak_rss = peak_rss()
+        return result, usage
+
+    with _AllocationTracer(limit) as tracer:
+        result = function(*args)
+    usage.peak_rss = peak_rss()
+    usage.peak_traced = tracer.peak
+    usage.top_allocations = tracer.top_allocations
+    return result, usage
+
+
+def format_bytes(size):
+    if size is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
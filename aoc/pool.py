@@ -0,0 +1,113 @@
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from .days import STATE_DIR, read_input
+from .runner import PARTS, run_day
+
+# The total time each day took the last time it was run, keyed by day number.
+TIMINGS_PATH = STATE_DIR / "timings.json"
+
+
+def load_recorded_timings():
+    try:
+        with open(TIMINGS_PATH, "r") as timings_file:
+            return {
+                int(day): seconds for day, seconds in json.load(timings_file).items()
+            }
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_recorded_timings(recorded_timings):
+    STATE_DIR.mkdir(exist_ok=True)
+    with open(TIMINGS_PATH, "w") as timings_file:
+        json.dump(recorded_timings, timings_file, indent=2, sort_keys=True)
+
+
+def schedule(days, recorded_timings):
+    """Order `days` longest-expected-first so the slowest days start immediately and
+    the short ones fill in the gaps at the end. Days that have never been timed are
+    started first since they could be slow.
+    """
+    return sorted(days, key=lambda day: -recorded_timings.get(day, math.inf))
+
+
+def _solve_day(day, parse_cache, result_cache):
+    return run_day(day, read_input(day), parse_cache, result_cache=result_cache)
+
+
+def run_days(days, max_workers=None, parse_cache=None, result_cache=None):
+    """Solve each of `days` in a pool of worker processes.
+
+    Args:
+        days (list): The days to solve.
+        max_workers (int): Number of worker processes. Defaults to the CPU count.
+        parse_cache (ParsedInputCache, optional): See `run_day`.
+        result_cache (ResultCache, optional): See `run_day`.
+
+    Returns:
+        tuple: A `{day: DayResult}` dictionary, a `{day: exception}` dictionary for
+        days that failed, and the wall-clock seconds for the whole run.
+    """
+    recorded_timings = load_recorded_timings()
+    results, errors = {}, {}
+    start = perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # The pool starts tasks in the order they are submitted.
+        futures = {
+            day: executor.submit(_solve_day, day, parse_cache, result_cache)
+            for day in schedule(days, recorded_timings)
+        }
+        for day, future in futures.items():
+            try:
+                results[day] = future.result()
+            except Exception as error:
+                errors[day] = error
+    wall_clock = perf_counter() - start
+
+    for day, result in results.items():
+        # Answers from the result cache say nothing about how long the day takes.
+        if not result.cached_parts:
+            recorded_timings[day] = sum(result.timings.values())
+    save_recorded_timings(recorded_timings)
+    return results, errors, wall_clock
+
+
+def format_table(results, errors, wall_clock):
+    header = (
+        f"{'Day':>3}  {'Part 1':>18}  {'Part 2':>18}"
+        f"  {'Parse':>8}  {'Part 1':>8}  {'Part 2':>8}  {'Total':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    # Multi-line answers (the day 13 grid) are printed after the table.
+    block_answers = []
+    for day in sorted(results.keys() | errors.keys()):
+        if day in errors:
+            lines.append(f"{day:>3}  error: {errors[day]!r}")
+            continue
+        result = results[day]
+        answers = []
+        for part in PARTS:
+            answer = str(result.answers.get(part, "-"))
+            if "\n" in answer:
+                block_answers.append(f"Day {day} {part}:\n{answer}")
+                answer = "(see below)"
+            answers.append(answer)
+        seconds = [result.timings.get(stage) for stage in ("parse",) + PARTS]
+        lines.append(
+            f"{day:>3}  {answers[0]:>18}  {answers[1]:>18}"
+            + "".join(
+                f"  {second:>7.3f}s" if second is not None else f"  {'-':>8}"
+                for second in seconds
+            )
+            + f"  {sum(result.timings.values()):>7.3f}s"
+        )
+    cpu_seconds = sum(sum(result.timings.values()) for result in results.values())
+    lines.append("-" * len(header))
+    lines.append(
+        f"Solved {len(results)} days in {wall_clock:.3f}s wall clock "
+        f"({cpu_seconds:.3f}s of solver time)."
+    )
+    return "\n".join(lines + block_answers)
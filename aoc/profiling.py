@@ -0,0 +1,288 @@
+import functools
+import inspect
+import json
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+
+from .days import STATE_DIR
+from .runner import PARTS
+
+PROFILE_DIR = STATE_DIR / "profile"
+
+# The functions that dominate each day's runtime. Days that are not listed here have
+# every function defined in their module profiled.
+HOT_FUNCTIONS = {
+    15: ["dijkstra"],
+    18: ["explode", "split"],
+    19: ["fit"],
+    22: ["intersect"],
+    23: ["possible_moves", "steps_to_final"],
+}
+
+# How often the sampling profiler records the stack of the profiled thread.
+DEFAULT_INTERVAL = 0.001
+
+
+def default_functions(day, module):
+    """Return the names of the functions of `module` to instrument for `day`."""
+    if day in HOT_FUNCTIONS:
+        return HOT_FUNCTIONS[day]
+    return [
+        name
+        for name, value in vars(module).items()
+        if inspect.isfunction(value)
+        and value.__module__ == module.__name__
+        and name not in ("parse",) + PARTS
+    ]
+
+
+class CallProfiler:
+    """Count the calls to and time spent in named functions of a day module.
+
+    While active, each named function (and the module's `parse` and parts, which
+    become the roots of the stacks) is replaced in the module namespace by a timing
+    wrapper. The functions call each other through the module namespace, so
+    recursive and nested calls are recorded too. The originals are put back on exit,
+    so nothing is instrumented unless a profiler is active.
+
+    Args:
+        module (module): A day module from `load_day`.
+        names (list): The functions to instrument.
+    """
+
+    mode = "calls"
+
+    def __init__(self, module, names):
+        missing = [name for name in names if not callable(getattr(module, name, None))]
+        if missing:
+            raise ValueError(f"{module.__name__} has no function {', '.join(missing)}")
+        self.module = module
+        roots = [name for name in ("parse",) + PARTS if hasattr(module, name)]
+        self.names = list(dict.fromkeys(roots + list(names)))
+        self.stats = {
+            name: {"calls": 0, "cumulative_seconds": 0.0, "self_seconds": 0.0}
+            for name in self.names
+        }
+        # Self seconds keyed by the `;`-joined call stack, as flame graphs expect.
+        self.stacks = Counter()
+        self._originals = {}
+        # The instrumented calls in progress, as `[name, seconds spent in callees]`.
+        self._stack = []
+        # How many calls to each function are in progress, so the cumulative time of
+        # a recursive function only counts the outermost call.
+        self._depth = Counter()
+
+    def __enter__(self):
+        for name in self.names:
+            function = getattr(self.module, name)
+            self._originals[name] = function
+            setattr(self.module, name, self._wrap(name, function))
+        return self
+
+    def __exit__(self, *exc_info):
+        for name, function in self._originals.items():
+            setattr(self.module, name, function)
+        self._originals.clear()
+
+    def _enter(self, name):
+        self._stack.append([name, 0.0])
+        self._depth[name] += 1
+
+    def _exit(self, name, elapsed):
+        _, callee_seconds = self._stack.pop()
+        self._depth[name] -= 1
+        stats = self.stats[name]
+        stats["self_seconds"] += elapsed - callee_seconds
+        if not self._depth[name]:
+            stats["cumulative_seconds"] += elapsed
+        path = ";".join([frame[0] for frame in self._stack] + [name])
+        self.stacks[path] += elapsed - callee_seconds
+        if self._stack:
+            self._stack[-1][1] += elapsed
+
+    def _wrap(self, name, function):
+        stats = self.stats[name]
+
+        if inspect.isgeneratorfunction(function):
+            # Calling a generator function only creates the generator, so time each
+            # step of the generator instead.
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                stats["calls"] += 1
+                generator = function(*args, **kwargs)
+                while True:
+                    self._enter(name)
+                    start = perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        self._exit(name, perf_counter() - start)
+                    yield item
+
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            stats["calls"] += 1
+            self._enter(name)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._exit(name, perf_counter() - start)
+
+        return wrapper
+
+    def report(self):
+        return {
+            "mode": self.mode,
+            "functions": {
+                name: {**stats, "seconds_per_call": _per_call(stats)}
+                for name, stats in self.stats.items()
+            },
+        }
+
+    def collapsed_stacks(self):
+        """Return the stacks in the collapsed format read by `flamegraph.pl` and
+        speedscope, weighted by microseconds of self time.
+        """
+        return [
+            f"{path} {round(seconds * 1e6)}"
+            for path, seconds in sorted(self.stacks.items())
+            if round(seconds * 1e6)
+        ]
+
+
+def _per_call(stats):
+    return stats["cumulative_seconds"] / stats["calls"] if stats["calls"] else 0.0
+
+
+class SamplingProfiler:
+    """Record the Python call stack of the current thread every `interval` seconds
+    from a background thread.
+
+    Unlike `CallProfiler` this sees every function, including library code, and its
+    overhead does not grow with the number of calls, but the times are estimates.
+    Only the frames from `module`'s source file onwards are kept, so the stacks
+    start at the day's `parse` or part instead of at the runner.
+    """
+
+    mode = "sampling"
+
+    def __init__(self, module, interval=DEFAULT_INTERVAL):
+        self.filename = module.__file__
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self):
+        # The sampler can only run when the profiled thread releases the GIL, which
+        # it is asked to do every `sys.getswitchinterval()` seconds.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._sampler.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename == self.filename:
+                    names.append(code.co_name)
+                else:
+                    names.append(f"{Path(code.co_filename).stem}.{code.co_name}")
+                if code.co_filename == self.filename and (
+                    frame.f_back is None
+                    or frame.f_back.f_code.co_filename != self.filename
+                ):
+                    # The outermost frame of the day module.
+                    break
+                frame = frame.f_back
+            else:
+                # Not inside the day module (e.g. reading the input).
+                continue
+            self.samples += 1
+            self.stacks[";".join(reversed(names))] += 1
+
+    def report(self):
+        total = Counter()
+        own = Counter()
+        for path, samples in self.stacks.items():
+            names = path.split(";")
+            own[names[-1]] += samples
+            for name in set(names):
+                total[name] += samples
+        return {
+            "mode": self.mode,
+            "interval_seconds": self.interval,
+            "samples": self.samples,
+            "functions": {
+                name: {
+                    "samples": total[name],
+                    "self_samples": own[name],
+                    "cumulative_seconds": total[name] * self.interval,
+                    "self_seconds": own[name] * self.interval,
+                }
+                for name, _ in total.most_common()
+            },
+        }
+
+    def collapsed_stacks(self):
+        """Return the stacks in the collapsed format, weighted by sample count."""
+        return [f"{path} {samples}" for path, samples in sorted(self.stacks.items())]
+
+
+def write_profile(profiler, prefix):
+    """Write `prefix.json` and `prefix.collapsed` and return their paths."""
+    prefix = Path(prefix)
+    prefix.parent.mkdir(parents=True, exist_ok=True)
+    json_path = prefix.with_name(prefix.name + ".json")
+    collapsed_path = prefix.with_name(prefix.name + ".collapsed")
+    with open(json_path, "w") as json_file:
+        json.dump(profiler.report(), json_file, indent=2)
+    with open(collapsed_path, "w") as collapsed_file:
+        collapsed_file.writelines(line + "\n" for line in profiler.collapsed_stacks())
+    return json_path, collapsed_path
+
+
+def format_profile(report, limit=15):
+    functions = sorted(
+        report["functions"].items(),
+        key=lambda item: -item[1]["cumulative_seconds"],
+    )[:limit]
+    width = max([len(name) for name, _ in functions] + [8])
+    if report["mode"] == "calls":
+        lines = [
+            f"  {'function':<{width}} {'calls':>10} {'cumulative':>11} {'self':>11}"
+        ]
+        for name, stats in functions:
+            lines.append(
+                f"  {name:<{width}} {stats['calls']:>10}"
+                f" {stats['cumulative_seconds']:>10.4f}s {stats['self_seconds']:>10.4f}s"
+            )
+    else:
+        lines = [
+            f"  {report['samples']} samples every {report['interval_seconds'] * 1e3:g}ms",
+            f"  {'function':<{width}} {'samples':>10} {'cumulative':>11} {'self':>11}",
+        ]
+        for name, stats in functions:
+            lines.append(
+                f"  {name:<{width}} {stats['samples']:>10}"
+                f" {stats['cumulative_seconds']:>10.4f}s {stats['self_seconds']:>10.4f}s"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+
+from .cache import MISSING
+from .days import load_day
+from .memory import format_bytes, measure_memory
+
+# The solver functions that every day module can define, in the order they are run.
+PARTS = ("part1", "part2")
+
+
+@dataclass
+class DayResult:
+    day: int
+    # Maps each part name (see `PARTS`) to its answer.
+    answers: dict = field(default_factory=dict)
+    # Maps "parse" and each part name to its wall-clock time in seconds. There is no
+    # "parse" timing if every answer came from the result cache.
+    timings: dict = field(default_factory=dict)
+    # Whether the parsed input was loaded from the parsed-input cache.
+    parse_cached: bool = False
+    # The parts whose answers were loaded from the result cache.
+    cached_parts: list = field(default_factory=list)
+    # Maps "parse" and each part name to its `MemoryUsage`, if memory was measured.
+    memory: dict = field(default_factory=dict)
+
+
+class CrossCheckError(Exception):
+    """Raised when a part's answer differs from the day's reference solution."""
+
+
+def timed(function, *args):
+    """Call `function(*args)` and return its result and the elapsed seconds."""
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def run_day(day, text, parse_cache=None, memory=None, result_cache=None):
+    """Parse `text` once and solve each part of `day` with the parsed input.
+
+    Args:
+        day (int): The day number to solve.
+        text (str): The raw puzzle input.
+        parse_cache (ParsedInputCache, optional): Load the parsed input from this
+            cache, and store it there on a miss. The parse timing then includes the
+            cache lookup.
+        memory (str, optional): "rss" to also record the peak RSS of each stage,
+            which costs almost nothing, or "trace" to additionally trace Python
+            allocations with `tracemalloc`, which makes the timings several times
+            slower.
+        result_cache (ResultCache, optional): Return the answers cached here instead
+            of solving the parts again, and cache the answers of the parts that are
+            solved. If every answer is cached the input is not even parsed.
+
+    Raises:
+        CrossCheckError: If the day has reference solutions for this input (see
+            `check_answers`) and an answer differs from them.
+
+    Returns:
+        DayResult: The answer to each part and the time spent parsing and solving.
+    """
+    module = load_day(day)
+    result = DayResult(day)
+    # Day 25 only has a single part.
+    parts = [part for part in PARTS if hasattr(module, part)]
+
+    if result_cache is not None:
+        for part in parts:
+            answer, seconds = timed(result_cache.get_answer, day, part, text)
+            if answer is not MISSING:
+                result.answers[part], result.timings[part] = answer, seconds
+                result.cached_parts.append(part)
+        if len(result.cached_parts) == len(parts):
+            return result
+
+    def run_stage(stage, function, *args):
+        if memory is None:
+            output, result.timings[stage] = timed(function, *args)
+        else:
+            measure = partial(measure_memory, trace=memory == "trace")
+            (output, result.memory[stage]), result.timings[stage] = timed(
+                measure, function, *args
+            )
+        return output
+
+    if parse_cache is None:
+        parsed = run_stage("parse", module.parse, text)
+    else:
+        parsed, result.parse_cached = run_stage(
+            "parse", parse_cache.parse, day, module, text
+        )
+    for part in parts:
+        if part in result.cached_parts:
+            continue
+        result.answers[part] = run_stage(part, getattr(module, part), parsed)
+        check_answers(module, parsed, part, result.answers[part])
+        if result_cache is not None:
+            result_cache.put_answer(day, part, text, result.answers[part])
+    # Keep the answers in the order of `PARTS` when only some of them were cached.
+    result.answers = {part: result.answers[part] for part in parts}
+    return result
+
+
+def check_answers(module, parsed, part, answer):
+    """Check `answer` against the day's reference (usually brute-force) solution of
+    `part`, if it has one.
+
+    A day module can define `reference_parts(parsed)`, which returns the reference
+    solver for each part that is fast enough on `parsed` (usually only on small
+    inputs). This runs outside of the timings.
+    """
+    if not hasattr(module, "reference_parts"):
+        return
+    reference = module.reference_parts(parsed).get(part)
+    if reference is None:
+        return
+    expected = reference(parsed)
+    if answer != expected:
+        raise CrossCheckError(
+            f"{module.__name__} {part} answered {answer} but the reference solution"
+            f" answered {expected}"
+        )
+
+
+def format_result(result):
+    lines = [f"Day {result.day}"]
+    if "parse" in result.timings:
+        lines.append(
+            f"  {'parse':<6} {result.timings['parse']:>10.4f}s"
+            + ("  (cached)" if result.parse_cached else "")
+        )
+    for part, answer in result.answers.items():
+        answer = str(answer)
+        # Multi-line answers (such as the day 13 grid) are printed below the timing.
+        inline_answer, _, block_answer = answer.partition("\n")
+        if block_answer:
+            inline_answer = ""
+        if part in result.cached_parts:
+            inline_answer = f"{inline_answer}  (cached)".lstrip()
+        lines.append(
+            f"  {part:<6} {result.timings[part]:>10.4f}s  {inline_answer}".rstrip()
+        )
+        if block_answer:
+            lines.append(answer)
+    if result.memory:
+        lines.append(format_memory(result.memory))
+    return "\n".join(lines)
+
+
+def format_memory(memory):
+    lines = [f"  {'stage':<6} {'peak RSS':>10} {'traced':>10}"]
+    for stage, usage in memory.items():
+        lines.append(
+            f"  {stage:<6} {format_bytes(usage.peak_rss):>10}"
+            f" {format_bytes(usage.peak_traced):>10}"
+            + ("" if usage.rss_reset else "  (peak of the whole process)")
+        )
+    for stage, usage in memory.items():
+        if usage.top_allocations:
+            lines.append(f"  Largest allocation sites near the {stage} peak:")
+        for site, size, count in usage.top_allocations:
+            lines.append(f"    {format_bytes(size):>10} in {count:>8} blocks  {site}")
+    return "\n".join(lines)
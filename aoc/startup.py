@@ -0,0 +1,87 @@
+import subprocess
+import sys
+from time import perf_counter
+
+from .days import ROOT, solver_path
+
+# Imports a day module the same way `load_day` does, without importing `aoc` itself.
+_IMPORT_DAY = """
+import importlib.util
+spec = importlib.util.spec_from_file_location("day{day}", {path!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+"""
+
+
+def parse_importtime(stderr):
+    """Parse the output of `python -X importtime`.
+
+    Returns:
+        dict: The cumulative microseconds of each top-level import (imports made by
+        other imports are included in their importer's time), in import order.
+    """
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, package = line[len("import time:") :].split("|")
+        # Nested imports are indented below the import that triggered them.
+        if package.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        imports[package.strip()] = int(cumulative)
+    return imports
+
+
+def measure_startup(code, repeat=3):
+    """Run `code` in a fresh interpreter with `-X importtime` `repeat` times.
+
+    Returns:
+        tuple: The fastest wall-clock seconds for the whole process and the
+        top-level import times from that run (see `parse_importtime`).
+    """
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        seconds = perf_counter() - start
+        if best is None or seconds < best[0]:
+            best = (seconds, parse_importtime(completed.stderr))
+    return best
+
+
+def startup_table(days, repeat=3, top=3):
+    """Measure the cost of starting the interpreter and importing each day's module.
+
+    The imports made by an interpreter that only imports the module loader are
+    measured once and left out of each day's import time, so the table shows what
+    each solution itself pulls in.
+    """
+    baseline_seconds, baseline_imports = measure_startup(
+        "import importlib.util", repeat
+    )
+    lines = [
+        f"{'Day':>3}  {'process':>9}  {'imports':>9}  heaviest imports",
+        f"{'-':>3}  {baseline_seconds * 1e3:>7.1f}ms  {'-':>9}"
+        "  (interpreter and module loader)",
+    ]
+    for day in days:
+        code = _IMPORT_DAY.format(day=day, path=str(solver_path(day)))
+        seconds, imports = measure_startup(code, repeat)
+        own = {
+            package: microseconds
+            for package, microseconds in imports.items()
+            if package not in baseline_imports
+        }
+        heaviest = sorted(own.items(), key=lambda item: -item[1])[:top]
+        lines.append(
+            (
+                f"{day:>3}  {seconds * 1e3:>7.1f}ms  {sum(own.values()) / 1e3:>7.1f}ms  "
+                + ", ".join(f"{package} {us / 1e3:.1f}ms" for package, us in heaviest)
+            ).rstrip()
+        )
+    return "\n".join(lines)
@@ -1,21 +1,129 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [int(line.strip()) for line in puzzle_input]
+import argparse
+import sys
+from collections import deque
 
 
-def count_greater(data):
-    return sum(item > data[idx] for idx, item in enumerate(data[1:]))
-    # Alternative option using `zip`:
-    # return sum(second > first for first, second in zip(data, data[1:]))
+def parse(text):
+    return [int(line) for line in text.split()]
 
 
-part1_solution = count_greater(puzzle_input)
-print(f"Part 1 Solution: {part1_solution}")
+def stream_depths(file):
+    """Yield the depths in `file` one line at a time, so the whole file is never in
+    memory at once."""
+    for line in file:
+        line = line.strip()
+        if line:
+            yield int(line)
 
-sliding_window_data = [
-    sum(puzzle_input[i - 1 : i + 2]) for i in range(1, len(puzzle_input))
-]
-# Alternative option using `zip`:
-# sliding_window_data = [sum(w) for w in zip(puzzle_input, puzzle_input[1:], puzzle_input[2:])]
-part2_solution = count_greater(sliding_window_data)
 
-print(f"Part 2 Solution: {part2_solution}")
+def count_increases(depths, windows=(1,)):
+    """For each window size in `windows`, count how many times the sum of that many
+    consecutive depths is larger than the sum of the previous window.
+
+    Two neighbouring windows share all but one depth, so comparing
+    `sum(depths[i + 1 : i + w + 1]) > sum(depths[i : i + w])` is the same as
+    comparing `depths[i + w] > depths[i]`. This only needs the last `max(windows)`
+    depths, which are kept in a ring buffer, so `depths` can be any iterable
+    (including `stream_depths`) no matter how long, and is only read once.
+
+    Returns:
+        dict: The number of increases for each window size.
+    """
+    counts = dict.fromkeys(windows, 0)
+    # A `deque` with a `maxlen` drops its oldest item when a new one is appended.
+    recent_depths = deque(maxlen=max(windows))
+    for depth in depths:
+        for window in counts:
+            # `recent_depths[-window]` is the depth `window` positions back.
+            if len(recent_depths) >= window:
+                counts[window] += depth > recent_depths[-window]
+        recent_depths.append(depth)
+    return counts
+
+
+def count_increases_numpy(file, windows=(1,), chunk_size=2**24):
+    """The same as `count_increases` but for very large files: `file` (opened in
+    binary mode) is read `chunk_size` bytes at a time and each chunk is compared
+    with NumPy. The last `max(windows)` depths of each chunk are carried over to the
+    next one.
+    """
+    import numpy as np
+
+    counts = dict.fromkeys(windows, 0)
+    carry = np.empty(0, dtype=np.int64)
+    leftover = b""
+    while True:
+        chunk = file.read(chunk_size)
+        finished = not chunk
+        # Only parse up to the last newline, since a chunk can end in the middle of a
+        # number. The rest is parsed with the next chunk.
+        chunk = leftover + chunk
+        end = len(chunk) if finished else chunk.rfind(b"\n") + 1
+        chunk, leftover = chunk[:end], chunk[end:]
+        depths = np.concatenate((carry, np.array(chunk.split(), dtype=np.int64)))
+        for window in counts:
+            # Only compare the new depths (after the carried over ones) with the depth
+            # `window` positions earlier, since the rest were compared last time.
+            start = max(len(carry), window)
+            if start < len(depths):
+                counts[window] += int(
+                    np.count_nonzero(
+                        depths[start:] > depths[start - window : len(depths) - window]
+                    )
+                )
+        carry = depths[-max(windows) :]
+        if finished:
+            return counts
+
+
+def part1(depths):
+    return count_increases(depths)[1]
+
+
+def part2(depths):
+    return count_increases(depths, windows=(3,))[3]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Count the depth increases in a sonar sweep without loading it "
+        "into memory."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="puzzle_input.txt",
+        help="The sonar sweep, or - for stdin (default: puzzle_input.txt).",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        nargs="+",
+        help="Count the increases of sums over these window sizes instead of "
+        "solving parts 1 and 2.",
+    )
+    parser.add_argument(
+        "--numpy",
+        action="store_true",
+        help="Compare the depths in large chunks with NumPy.",
+    )
+    args = parser.parse_args()
+    if args.window and min(args.window) < 1:
+        parser.error("window sizes must be at least 1")
+
+    # Part 1 compares single depths and part 2 windows of three depths.
+    windows = args.window or (1, 3)
+    path = sys.stdin.fileno() if args.input == "-" else args.input
+    if args.numpy:
+        with open(path, "rb") as file:
+            counts = count_increases_numpy(file, windows)
+    else:
+        with open(path, "r") as file:
+            counts = count_increases(stream_depths(file), windows)
+
+    if args.window:
+        for window, count in counts.items():
+            print(f"Window {window}: {count}")
+    else:
+        print(f"Part 1 Solution: {counts[1]}")
+        print(f"Part 2 Solution: {counts[3]}")
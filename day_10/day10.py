@@ -1,7 +1,16 @@
-from statistics import median
+import argparse
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.strip() for line in puzzle_input]
+# Allow running this file directly from inside `day_10` to import the shared `aoc`
+# package from the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.chunks import byte_ranges, read_range  # noqa: E402
 
 # Scores as defined by the challenge.
 part1_character_scores = {
@@ -13,53 +22,203 @@ part1_character_scores = {
 part2_character_scores = {"]": 2, ")": 1, "}": 3, ">": 4}
 open_to_close_character = {"(": ")", "[": "]", "{": "}", "<": ">"}
 
-# These variables will hold the score of each line from the `puzzle_input`
-part1_line_scores = []
-part2_line_scores = []
 
-for line in puzzle_input:
+def parse(text):
+    return text.split()
+
+
+def check_line(line):
+    """Check the syntax of a single line.
+
+    Returns:
+        tuple: The syntax error score of the line (0 unless it is corrupted) and its
+        completion score (`None` if it is corrupted).
+    """
     # Initialize a `stack` to keep track of the open chunks.
     stack = []
-    # Keep track of whether or not a line is corrupted (where a chunk closes with
-    # the wrong character).
-    corrupted = False
     for character in line:
-        # If the current character is a character that opens a chunk, then add it to
-        # the `stack`.
+        # If the current character is a character that opens a chunk, then add it
+        # to the `stack`.
         if character in "([{<":
             stack.append(character)
         else:
-            # Remove the starting character for the last-opened chunk from the `stack`
-            # and store its matching closing character in `expected_character`.
+            # Remove the starting character for the last-opened chunk from the
+            # `stack` and store its matching closing character in
+            # `expected_character`.
             expected_character = open_to_close_character[stack.pop()]
-            # If the current character is not the expected character, then the line is
-            # corrupt and we can calculate the part 1 score for this line.
+            # If the current character is not the expected character, then the line
+            # is corrupt and the score is the score for this character, which is the
+            # first incorrect closing character.
             if character != expected_character:
-                # Get the score for this character, which is the first incorrect
-                # closing character, and append it to `part1_line_scores`.
-                part1_line_scores.append(part1_character_scores[character])
-                corrupted = True
-                break
-    # After looping through each character, if the line is not marked as corrupted
-    # (there are no incorrect characters, but it is missing some closing characters
-    # at the end of the line) then calculate the part 2 score.
-    if not corrupted:
-        # We need to reverse the `stack` because the part 2 score is calculated in
-        # the order of the characters used to close the line. Our `stack` contains
-        # the most recent recent opening character at the end, so we must flip it.
-        score = 0
-        stack.reverse()
-        # For each character, multiply the total score by 5 and then increase the
-        # total score by the point value given for the character in
-        # `part2_character_scores`.
-        for character in stack:
-            score = (
-                score * 5 + part2_character_scores[open_to_close_character[character]]
-            )
-        part2_line_scores.append(score)
-
-part1_solution = sum(part1_line_scores)
-print(f"Part 1 Solution: {part1_solution}")
-
-part2_solution = median(part2_line_scores)
-print(f"Part 2 Solution: {part2_solution}")
+                return part1_character_scores[character], None
+    # After looping through each character, the line is not corrupted (there are no
+    # incorrect characters, but it may be missing some closing characters at the end
+    # of the line), so calculate the part 2 score. The part 2 score is calculated in
+    # the order of the characters used to close the line. Our `stack` contains the
+    # most recent opening character at the end, so we must go through it backwards.
+    score = 0
+    # For each character, multiply the total score by 5 and then increase the total
+    # score by the point value given for the character in `part2_character_scores`.
+    for character in reversed(stack):
+        score = score * 5 + part2_character_scores[open_to_close_character[character]]
+    return 0, score
+
+
+def score_lines(lines):
+    # These variables will hold the score of each line from the `lines`
+    part1_line_scores = []
+    part2_line_scores = []
+    for line in lines:
+        syntax_error_score, completion_score = check_line(line)
+        if completion_score is None:
+            part1_line_scores.append(syntax_error_score)
+        else:
+            part2_line_scores.append(completion_score)
+    return part1_line_scores, part2_line_scores
+
+
+def select(values, rank):
+    """Return the value that would be at index `rank` if `values` were sorted.
+
+    This is quickselect: partition around a random pivot and only continue with the
+    side that holds `rank`, which takes linear time on average instead of the
+    `O(n log n)` of sorting.
+    """
+    while True:
+        pivot = random.choice(values)
+        lower = [value for value in values if value < pivot]
+        if rank < len(lower):
+            values = lower
+            continue
+        num_equal = sum(value == pivot for value in values)
+        if rank < len(lower) + num_equal:
+            return pivot
+        rank -= len(lower) + num_equal
+        values = [value for value in values if value > pivot]
+
+
+def part1(lines):
+    part1_line_scores, _ = score_lines(lines)
+    return sum(part1_line_scores)
+
+
+def part2(lines):
+    _, part2_line_scores = score_lines(lines)
+    # There is always an odd number of incomplete lines, so the median is the middle
+    # score.
+    return select(part2_line_scores, len(part2_line_scores) // 2)
+
+
+# The parallel solution below reads a (possibly huge) file in chunks of lines and
+# checks the chunks in separate processes. Part 1 is a sum over the chunks. For part
+# 2, each chunk first only counts its completion scores in buckets of nearby scores,
+# so the counts of all chunks can be added up without keeping every score. That
+# tells which bucket holds the median and its rank there, and a second pass over the
+# file collects just the scores in that bucket to select the median from.
+
+# The number of leading bits of a completion score that decide its bucket.
+BUCKET_BITS = 16
+
+
+def score_bucket(score):
+    """Return the bucket of a completion score. Buckets sort in the same order as the
+    scores in them."""
+    length = score.bit_length()
+    return length, score >> max(length - BUCKET_BITS, 0)
+
+
+def _read_lines(path, start, end):
+    """Return the lines of `path` that start in the byte range `[start, end)`."""
+    return read_range(path, start, end).decode().split()
+
+
+def _summarize_range(path, start, end):
+    """Return the syntax error score and the bucket counts of the completion scores
+    of the lines in a range of `path`."""
+    syntax_error_total = 0
+    bucket_counts = Counter()
+    for line in _read_lines(path, start, end):
+        syntax_error_score, completion_score = check_line(line)
+        if completion_score is None:
+            syntax_error_total += syntax_error_score
+        else:
+            bucket_counts[score_bucket(completion_score)] += 1
+    return syntax_error_total, bucket_counts
+
+
+def _bucket_scores(bucket, path, start, end):
+    """Return the completion scores in `bucket` of the lines in a range of `path`."""
+    scores = []
+    for line in _read_lines(path, start, end):
+        _, completion_score = check_line(line)
+        if completion_score is not None and score_bucket(completion_score) == bucket:
+            scores.append(completion_score)
+    return scores
+
+
+def _solve_chunks(map_chunks, paths, starts, ends):
+    syntax_error_total = 0
+    bucket_counts = Counter()
+    for chunk_total, chunk_counts in map_chunks(_summarize_range, paths, starts, ends):
+        syntax_error_total += chunk_total
+        bucket_counts.update(chunk_counts)
+    if not bucket_counts:
+        # Every line is corrupted, so there is no middle completion score.
+        return syntax_error_total, None
+
+    # Find the bucket of the middle score and the middle score's rank in it.
+    rank = sum(bucket_counts.values()) // 2
+    for bucket, count in sorted(bucket_counts.items()):
+        if rank < count:
+            break
+        rank -= count
+    scores = []
+    for chunk_scores in map_chunks(
+        partial(_bucket_scores, bucket), paths, starts, ends
+    ):
+        scores.extend(chunk_scores)
+    return syntax_error_total, select(scores, rank)
+
+
+def solve_file(path, workers=1, chunk_size=2**24):
+    """Solve both parts for a (possibly huge) file of lines by checking chunks of
+    `chunk_size` bytes, in parallel processes with more than one worker. Only the
+    bucket counts and the scores in the median's bucket are ever kept in memory.
+
+    Returns:
+        tuple: The part 1 and part 2 answers. The part 2 answer is `None` if there
+        are no incomplete lines.
+    """
+    starts, ends = byte_ranges(path, chunk_size)
+    paths = [path] * len(starts)
+    if workers == 1:
+        return _solve_chunks(map, paths, starts, ends)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return _solve_chunks(executor.map, paths, starts, ends)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the navigation subsystem.")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="puzzle_input.txt",
+        help="The navigation subsystem (default: puzzle_input.txt).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Check the file in chunks across this many processes, without loading "
+        "all of it into memory.",
+    )
+    args = parser.parse_args()
+
+    if args.workers:
+        part1_solution, part2_solution = solve_file(args.input, args.workers)
+    else:
+        with open(args.input, "r") as puzzle_input:
+            lines = parse(puzzle_input.read())
+        part1_solution, part2_solution = part1(lines), part2(lines)
+
+    print(f"Part 1 Solution: {part1_solution}")
+    print(f"Part 2 Solution: {part2_solution}")
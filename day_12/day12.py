@@ -1,73 +1,120 @@
 from collections import defaultdict
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.strip().split("-") for line in puzzle_input]
 
-# Create a dictionary so we can look up a cave and get a list of the caves that are
-# connected to it.
-cave_connections = defaultdict(list)
-for cave_a, cave_b in puzzle_input:
-    cave_connections[cave_a].append(cave_b)
-    cave_connections[cave_b].append(cave_a)
+def parse(text):
+    """Compile the cave system into a graph of small caves with integer ids.
 
+    Big caves can be visited any number of times, so passing through one is just a
+    way to get between two of its neighbors (which are small caves, since two
+    connected big caves would allow infinitely many paths). Each big cave is replaced
+    by connections between every pair of its neighbors, including a neighbor and
+    itself, and each connection counts how many ways there are to make that move.
 
-def find_paths(cave_name, small_caves_seen, duplicate_cave_visited, allow_duplicate):
-    """Find the number of paths starting at the `cave_name` cave and ending at the
-    "end" cave.
+    Connections into "start" are dropped, since no path can return to it, and so are
+    connections out of "end", where every path stops.
+
+    Returns:
+        tuple: A list with the `(neighbor, num_ways)` connections of each small cave,
+        and the ids of "start" and "end". Small cave `i` is bit `1 << i` of the masks
+        of visited caves in `count_paths`.
+    """
+    # Create a dictionary so we can look up a cave and get a list of the caves that are
+    # connected to it.
+    cave_connections = defaultdict(list)
+    for line in text.split():
+        cave_a, cave_b = line.split("-")
+        cave_connections[cave_a].append(cave_b)
+        cave_connections[cave_b].append(cave_a)
+
+    small_caves = [cave for cave in cave_connections if cave.islower()]
+    cave_ids = {cave: cave_id for cave_id, cave in enumerate(small_caves)}
+    start, end = cave_ids["start"], cave_ids["end"]
+    # `num_ways[a][b]` is the number of ways to move from small cave `a` to small
+    # cave `b` directly or through one big cave.
+    num_ways = [defaultdict(int) for _ in small_caves]
+    for cave, connected_caves in cave_connections.items():
+        if cave.islower():
+            for connected_cave in connected_caves:
+                if connected_cave.islower():
+                    num_ways[cave_ids[cave]][cave_ids[connected_cave]] += 1
+            continue
+        for connected_cave in connected_caves:
+            if connected_cave.isupper():
+                raise ValueError(
+                    f"Big caves {cave} and {connected_cave} are connected, so there "
+                    "are infinitely many paths"
+                )
+            for other_cave in connected_caves:
+                num_ways[cave_ids[connected_cave]][cave_ids[other_cave]] += 1
+
+    neighbors = [
+        [
+            (neighbor, count)
+            for neighbor, count in num_ways[cave_id].items()
+            if neighbor != start and cave_id != end
+        ]
+        for cave_id in range(len(small_caves))
+    ]
+    return neighbors, start, end
+
+
+def count_paths(caves, allow_duplicate):
+    """Count the paths from "start" to "end" that visit each small cave at most once,
+    or (with `allow_duplicate`) a single small cave twice.
+
+    The number of ways to continue a path only depends on its current cave, the set
+    of small caves it has visited (as a bitmask) and whether it has used its
+    duplicate visit, so instead of following every path one at a time, the paths
+    that reach the same state are counted together.
+
+    Every move either visits a new small cave or uses up the duplicate visit, so the
+    states are grouped into stages by `2 * visited caves + duplicate used`, and moves
+    always go to a later stage. Processing the stages in order is an iterative
+    dynamic program over the states, which cannot hit the recursion limit, and whose
+    cost depends on the number of states rather than the number of paths.
 
     Args:
-        cave_name (str): The cave name to begin searching from.
-        small_caves_seen (set): A set of small caves that have already been visited
-            and cannot be visited again.
-        duplicate_cave_visited (boolean): Wheather or not a single small cave has been
-            visited twice (for part 2).
+        caves (tuple): The compiled cave system from `parse`.
         allow_duplicate (boolean): If a single small cave is allowed to be visited
             twice. This distinguishes part 1 from part 2.
 
     Returns:
         int: The number of paths from "start" to "end".
     """
-    # If we are at the end then return `1`` since we have found a valid path.
-    if cave_name == "end":
-        return 1
-    # If we are finding paths in part 2 and the `cave_name` is "start" or "end" and
-    # we have seen at least once small cave, then return 0 because the "start" and
-    # "end" caves can only be visited once and cannot be the single duplicate cave.
-    if allow_duplicate and cave_name in ["start", "end"] and small_caves_seen:
-        return 0
-    # Make a copy of the `small_caves_seen` to prevent the same `small_caves_seen`
-    # from being shared among all calls to `find_paths`.
-    new_small_caves_seen = small_caves_seen.copy()
-    # If the cave is a small cave and it has already been visited, return 0 because
-    # this is an invalid path... unless we are allowing a single duplicate small cave
-    # and the duplicate cave has not yet been visited.
-    if cave_name.islower():
-        if cave_name in small_caves_seen:
-            if allow_duplicate and not duplicate_cave_visited:
-                duplicate_cave_visited = True
-            else:
-                return 0
-        # Always add the small cave to the list of `small_caves_seen` so it is not
-        # visited twice.
-        new_small_caves_seen.add(cave_name)
-    # Compute the number of paths from each cave connected to this cave and sum them
-    # by recursively calling this (`find_paths`) function.
-    num_paths = sum(
-        find_paths(
-            adjacent_cave,
-            new_small_caves_seen,
-            duplicate_cave_visited,
-            allow_duplicate,
-        )
-        for adjacent_cave in cave_connections[cave_name]
-    )
-    # Finally, return the number of valid paths.
+    neighbors, start, end = caves
+    # `stages[stage]` maps each `(cave, visited)` state in the stage to the number of
+    # paths from "start" that reach it.
+    stages = [defaultdict(int) for _ in range(2 * len(neighbors) + 2)]
+    stages[2][start, 1 << start] = 1
+    num_paths = 0
+    for stage, states in enumerate(stages):
+        duplicate_used = stage % 2
+        for (cave, visited), state_paths in states.items():
+            for neighbor, num_ways in neighbors[cave]:
+                if neighbor == end:
+                    num_paths += state_paths * num_ways
+                elif not visited >> neighbor & 1:
+                    stages[stage + 2][neighbor, visited | 1 << neighbor] += (
+                        state_paths * num_ways
+                    )
+                elif allow_duplicate and not duplicate_used:
+                    stages[stage + 1][neighbor, visited] += state_paths * num_ways
     return num_paths
 
 
-# Find the number of paths when you can visit small caves at most once.
-part1_num_paths = find_paths("start", set(), None, allow_duplicate=False)
-print(f"Part 1 Solution: {part1_num_paths}")
-# Find the number of paths when you can visit a single small cave twice.
-part2_num_paths = find_paths("start", set(), False, allow_duplicate=True)
-print(f"Part 2 Solution: {part2_num_paths}")
+def part1(caves):
+    # Find the number of paths when you can visit small caves at most once.
+    return count_paths(caves, allow_duplicate=False)
+
+
+def part2(caves):
+    # Find the number of paths when you can visit a single small cave twice.
+    return count_paths(caves, allow_duplicate=True)
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        caves = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(caves)}")
+    print(f"Part 2 Solution: {part2(caves)}")
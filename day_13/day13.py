@@ -1,17 +1,25 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
-
-# Split the input into the coordinates and flip instructions.
-coords, flips = puzzle_input.split("\n\n")
-# Parse the dot coordinates into a set of tuples in the form `(x, y)`.
-dots = set((int(x) for x in line.split(",")) for line in coords.split("\n"))
-# Parse the flips into a list of tuples in the form `(axis, position)`.
-flips = [tuple(instruction.split()[-1].split("=")) for instruction in flips.split("\n")]
-
-# Define variable to store the output of the first flip.
-first_flip = None
-# Perform the flip/reflection for each flip instruction.
-for idx, flip_instruction in enumerate(flips):
+from itertools import chain
+
+# Importing NumPy takes about 110 ms. Folding in pure Python costs 1.4 µs per dot
+# for the 12 folds of the puzzle input and 11 µs per dot for 22 folds (9.1 s vs
+# 0.33 s for 800,000 dots), so NumPy wins from somewhere between 10,000 and 80,000
+# dots depending on the number of folds.
+NUMPY_MIN_DOTS = 20_000
+
+
+def parse(text):
+    # Split the input into the coordinates and flip instructions.
+    coords, flips = text.strip().split("\n\n")
+    # Parse the dot coordinates into a set of tuples in the form `(x, y)`.
+    dots = set(tuple(int(x) for x in line.split(",")) for line in coords.split("\n"))
+    # Parse the flips into a list of tuples in the form `(axis, position)`.
+    flips = [
+        tuple(instruction.split()[-1].split("=")) for instruction in flips.split("\n")
+    ]
+    return dots, flips
+
+
+def fold(dots, flip_instruction):
     axis, position = flip_instruction
     position = int(position)
 
@@ -37,29 +45,120 @@ for idx, flip_instruction in enumerate(flips):
             # If the coordinates are not in the region to be flipped, then simply add
             # them to the `new_dots` set.
             new_dots.add((x, y))
+    return new_dots
+
+
+def dots_array(dots):
+    """Return the `dots` as an `(n, 2)` NumPy array of `(x, y)` rows."""
+    import numpy as np
+
+    coordinates = np.fromiter(chain.from_iterable(dots), np.int64, 2 * len(dots))
+    return coordinates.reshape(-1, 2)
+
+
+def compose_folds(positions, size):
+    """Compose the folds at each of `positions` along one axis, in order, into a
+    single mapping of that axis.
+
+    The table is built from the last fold back to the first: each fold extends the
+    table for the coordinates after it to the (usually larger) range of coordinates
+    before it, by looking up where the fold sends each of them. When every fold
+    halves the paper, building the table takes time proportional to `size` however
+    many folds there are. Folds along the other axis do not change these
+    coordinates, so they are skipped.
 
-    dots = new_dots
-    # If we just computed the first flip, then store the output so we can find the
-    # answer to part 1 of the puzzle.
-    if idx == 0:
-        first_flip = new_dots
+    Args:
+        positions (list): The fold lines along this axis, in the order of the folds.
+        size (int): The number of coordinates along this axis before any fold.
 
-part1_solution = len(first_flip)
-print(f"Part 1 Solution: {part1_solution}")
+    Returns:
+        ndarray: `table[c]` is where coordinate `c` ends up after all the folds.
+    """
+    import numpy as np
 
+    # The lowest and highest coordinate before each fold and after the last one. A
+    # fold can make coordinates negative when it is less than halfway along, or when
+    # a dot that was on an earlier fold line is folded again.
+    ranges = [(0, size - 1)]
+    for position in positions:
+        low, high = ranges[-1]
+        if high > position:
+            low, high = min(low, 2 * position - high), position
+        ranges.append((low, high))
+    low_after, high_after = ranges[-1]
+    # `table[c - low_after]` is where coordinate `c` ends up after the last fold.
+    table = np.arange(low_after, high_after + 1)
+    for position, (low, high) in zip(reversed(positions), reversed(ranges[:-1])):
+        coordinates = np.arange(low, high + 1)
+        folded = np.where(
+            coordinates > position, 2 * position - coordinates, coordinates
+        )
+        table = table[folded - low_after]
+        low_after = low
+    return table
 
-def print_grid(dots):
+
+def fold_numpy(coordinates, flips):
+    """Apply all of the `flips` to the `(n, 2)` array of dot `coordinates` at once.
+
+    Returns:
+        ndarray: The distinct `(x, y)` dots after the folds, as an `(m, 2)` array.
+    """
+    import numpy as np
+
+    folded = np.empty_like(coordinates)
+    for column, axis in enumerate("xy"):
+        positions = [
+            int(position) for flip_axis, position in flips if flip_axis == axis
+        ]
+        table = compose_folds(positions, int(coordinates[:, column].max()) + 1)
+        folded[:, column] = table[coordinates[:, column]]
+    # Pack each dot into a single integer, so sorting them puts the dots that landed
+    # on top of each other next to each other, where they are easy to drop. This is
+    # what `np.unique` does, but recent versions of it use a hash table for integers,
+    # which is several times slower than sorting here.
+    low = folded.min(axis=0)
+    height = int(folded[:, 1].max() - low[1]) + 1
+    packed = np.sort((folded[:, 0] - low[0]) * height + folded[:, 1] - low[1])
+    packed = packed[np.concatenate(([True], packed[1:] != packed[:-1]))]
+    return np.column_stack(np.divmod(packed, height)) + low
+
+
+def part1(manual):
+    dots, flips = manual
+    if len(dots) >= NUMPY_MIN_DOTS:
+        return len(fold_numpy(dots_array(dots), flips[:1]))
+    # The part 1 solution is the number of dots after only the first flip.
+    return len(fold(dots, flips[0]))
+
+
+def render_grid(dots):
     max_x = max(x for x, _ in dots)
     max_y = max(y for _, y in dots)
 
-    for y in range(max_y + 1):
-        for x in range(max_x + 1):
-            # Print a "#" if the current coordinate is the position of a dot, otherwise
-            # just display a space.
-            print("#" if (x, y) in dots else " ", end="")
-        print()  # Print a newline after each x-axis line
-    print()  # Print a newline after the entire grid has been displayed
+    # Use a "#" if the current coordinate is the position of a dot, otherwise just
+    # display a space. Each x-axis line is separated by a newline.
+    return "\n".join(
+        "".join("#" if (x, y) in dots else " " for x in range(max_x + 1))
+        for y in range(max_y + 1)
+    )
+
+
+def part2(manual):
+    dots, flips = manual
+    if len(dots) >= NUMPY_MIN_DOTS:
+        folded = fold_numpy(dots_array(dots), flips)
+        return render_grid(set(map(tuple, folded.tolist())))
+    # Perform the flip/reflection for each flip instruction.
+    for flip_instruction in flips:
+        dots = fold(dots, flip_instruction)
+    return render_grid(dots)
+
 
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        manual = parse(puzzle_input.read())
 
-print("Part 2 Solution:")
-print_grid(dots)
+    print(f"Part 1 Solution: {part1(manual)}")
+    print("Part 2 Solution:")
+    print(part2(manual))
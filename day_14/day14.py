@@ -1,28 +1,32 @@
 from collections import Counter
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
 
-polymer_template, pair_insertion_rules = puzzle_input.split("\n\n")
+def parse(text):
+    polymer_template, pair_insertion_rules = text.strip().split("\n\n")
 
-polymer_template = polymer_template.strip()
-# Parse the `pair_insertion_rules` into a dictionary of the follwing form:
-# `(pair_a, pair_b): insertion_char`.
-pair_insertion_rules = dict(x.split(" -> ") for x in pair_insertion_rules.split("\n"))
-pair_insertion_rules = {tuple(x): y for x, y in pair_insertion_rules.items()}
+    polymer_template = polymer_template.strip()
+    # Parse the `pair_insertion_rules` into a dictionary of the follwing form:
+    # `(pair_a, pair_b): insertion_char`.
+    pair_insertion_rules = dict(
+        x.split(" -> ") for x in pair_insertion_rules.split("\n")
+    )
+    pair_insertion_rules = {tuple(x): y for x, y in pair_insertion_rules.items()}
 
-# Convert the starting `polymer_template` into a dictionary of the character counts.
-character_counts = Counter(polymer_template)
-# Count the pairs in the starting `polymer_template`. A pair consists of two adjacent
-# characters. Pairs can overlap. We only loop to `len(polymer_template)-1` so that we
-# do not go out of bounds on the list when we call `polymer_template[x+1]`.
-pairs = Counter(
-    (polymer_template[x], polymer_template[x + 1])
-    for x in range(len(polymer_template) - 1)
-)
+    # Convert the starting `polymer_template` into a dictionary of the character
+    # counts.
+    character_counts = Counter(polymer_template)
+    # Count the pairs in the starting `polymer_template`. A pair consists of two
+    # adjacent characters. Pairs can overlap. We only loop to `len(polymer_template)-1`
+    # so that we do not go out of bounds on the list when we call
+    # `polymer_template[x+1]`.
+    pairs = Counter(
+        (polymer_template[x], polymer_template[x + 1])
+        for x in range(len(polymer_template) - 1)
+    )
+    return character_counts, pairs, pair_insertion_rules
 
 
-def solve(num_steps, character_counts, pairs):
+def solve(num_steps, character_counts, pairs, pair_insertion_rules):
     # For each step...
     for _ in range(num_steps):
         # Make a copy of the `pairs` so that we can perform the pair insertions
@@ -51,9 +55,21 @@ def solve(num_steps, character_counts, pairs):
     return max(character_counts.values()) - min(character_counts.values())
 
 
-# Use `.copy()` to ensure that each run to the function gets the original
-# `puzzle_input` data.
-part1_solution = solve(10, character_counts.copy(), pairs.copy())
-print(f"Part 1 Solution: {part1_solution}")
-part2_solution = solve(40, character_counts.copy(), pairs.copy())
-print(f"Part 2 Solution: {part2_solution}")
+def part1(polymer):
+    character_counts, pairs, pair_insertion_rules = polymer
+    # Use `.copy()` to ensure that each run to the function gets the original
+    # parsed data.
+    return solve(10, character_counts.copy(), pairs.copy(), pair_insertion_rules)
+
+
+def part2(polymer):
+    character_counts, pairs, pair_insertion_rules = polymer
+    return solve(40, character_counts.copy(), pairs.copy(), pair_insertion_rules)
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        polymer = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(polymer)}")
+    print(f"Part 2 Solution: {part2(polymer)}")
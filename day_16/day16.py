@@ -1,22 +1,19 @@
 from operator import add, mul, gt, lt, eq
 from functools import reduce
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
 
-# A list to keep track of the versions of all packets.
-packet_versions = []
-
-# Convert the puzzle input from hexadecimal to binary.
-binary_packets = bin(int(puzzle_input, 16))[2:]
-# Pad the input according to the challenge instructions.
-while len(binary_packets) < 4 * len(puzzle_input):
-    binary_packets = "0" + binary_packets
-# Reverse the binary packets so we can easily pop off bit by bit.
-binary_packets = list(binary_packets)
-binary_packets.reverse()
-# Convert each binary digit from a string to an integer.
-binary_packets = [int(x) for x in binary_packets]
+def parse(text):
+    hex_packets = text.strip()
+    # Convert the puzzle input from hexadecimal to binary.
+    binary_packets = bin(int(hex_packets, 16))[2:]
+    # Pad the input according to the challenge instructions.
+    while len(binary_packets) < 4 * len(hex_packets):
+        binary_packets = "0" + binary_packets
+    # Reverse the binary packets so we can easily pop off bit by bit.
+    binary_packets = list(binary_packets)
+    binary_packets.reverse()
+    # Convert each binary digit from a string to an integer.
+    return [int(x) for x in binary_packets]
 
 
 def read_bits(data, num_bits):
@@ -50,15 +47,13 @@ def read_num(data, num_bits):
 operations = [add, mul, min, max, lambda x, y: (x << 4) | y, gt, lt, eq]
 
 
-def parse(data):
-    # Keep track of `packet_versions` accross all function calls.
-    global packet_versions
-
+def parse_packet(data, packet_versions):
     # Read the `version` and `type_id` from the first packet.
     version = read_num(data, 3)
     type_id = read_num(data, 3)
 
-    # Add the version of the packet to the `packet_versions` list.
+    # Add the version of the packet to the `packet_versions` list, which is shared
+    # accross all function calls.
     packet_versions.append(version)
 
     def get_subpackets():
@@ -80,7 +75,7 @@ def parse(data):
                 # `read_num(data, 11)` represents the number of subpackets in this
                 # operator packet. Loop through them and yield them.
                 for _ in range(read_num(data, 11)):
-                    yield parse(data)
+                    yield parse_packet(data, packet_versions)
             else:  # If the `length_type_id` is 0.
                 # `bit_length` is the number of bits of packets in the operator packet.
                 bit_length = read_num(data, 15)
@@ -89,7 +84,7 @@ def parse(data):
                 # length of the data equals the number of bits that should remain once
                 # the operator packet is complete.
                 while len(data) != bits_remaining_when_operator_done:
-                    yield parse(data)
+                    yield parse_packet(data, packet_versions)
 
     # Get the operation for the current packet.
     operation = operations[type_id]
@@ -97,8 +92,27 @@ def parse(data):
     return reduce(operation, get_subpackets())
 
 
-final_packet_output = parse(binary_packets)
-packet_versions_sum = sum(packet_versions)
+def decode(binary_packets):
+    # A list to keep track of the versions of all packets.
+    packet_versions = []
+    # Copy the `binary_packets` since `parse_packet` pops bits off of the list.
+    final_packet_output = parse_packet(binary_packets.copy(), packet_versions)
+    return packet_versions, final_packet_output
+
+
+def part1(binary_packets):
+    packet_versions, _ = decode(binary_packets)
+    return sum(packet_versions)
+
+
+def part2(binary_packets):
+    _, final_packet_output = decode(binary_packets)
+    return final_packet_output
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        binary_packets = parse(puzzle_input.read())
 
-print(f"Part 1 Solution: {packet_versions_sum}")
-print(f"Part 2 Solution: {final_packet_output}")
+    print(f"Part 1 Solution: {part1(binary_packets)}")
+    print(f"Part 2 Solution: {part2(binary_packets)}")
@@ -3,12 +3,13 @@ import json
 from functools import reduce
 from itertools import permutations
 
-with open("puzzle_input.txt", "r") as puzzle_input:
+
+def parse(text):
     # Read the puzzle input by applying the `json.loads` function to each line of the
-    # `puzzle_input`. This will create a list where each item is the Python object
+    # `text`. This will create a list where each item is the Python object
     # representation (list of lists of lists etc) of the corresponding line of the
-    # `puzzle_input`.
-    puzzle_input = list(map(json.loads, puzzle_input.read().strip().splitlines()))
+    # puzzle input.
+    return list(map(json.loads, text.strip().splitlines()))
 
 
 def add_right(number, left):
@@ -138,19 +139,26 @@ def magnitude(number):
     return 3 * magnitude(number[0]) + 2 * magnitude(number[1])
 
 
-# Apply the `add` function cumulatively to the `puzzle_input` in groups of two, from
-# left to right, so as to reduce the `puzzle_input` to a single value by essentially
-# adding all of the values together.
-final_number = reduce(add, puzzle_input)
-# Recursively calculate the magnitude of the final snailfish number sum according to
-# the challenge description.
-part1_solution = magnitude(final_number)
-print(f"Part 1 Solution: {part1_solution}")
-
-# For each permutation of two snailfish numbers in the `puzzle_input`, `add` them
-# together, and calculate the magnitude of the sum. Then, find the maximum sum in
-# this list.
-largest_2_sum_magnitude = max(
-    magnitude(add(a, b)) for a, b in permutations(puzzle_input, 2)
-)
-print(f"Part 2 Solution: {largest_2_sum_magnitude}")
+def part1(numbers):
+    # Apply the `add` function cumulatively to the `numbers` in groups of two, from
+    # left to right, so as to reduce the `numbers` to a single value by essentially
+    # adding all of the values together.
+    final_number = reduce(add, numbers)
+    # Recursively calculate the magnitude of the final snailfish number sum according
+    # to the challenge description.
+    return magnitude(final_number)
+
+
+def part2(numbers):
+    # For each permutation of two snailfish numbers in the `numbers`, `add` them
+    # together, and calculate the magnitude of the sum. Then, find the maximum sum in
+    # this list.
+    return max(magnitude(add(a, b)) for a, b in permutations(numbers, 2))
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        numbers = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(numbers)}")
+    print(f"Part 2 Solution: {part2(numbers)}")
@@ -1,24 +1,23 @@
 import math
 from itertools import combinations
 import numpy as np
-from scipy.spatial.distance import cdist
-
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip().split("\n\n")
-
-# Parse the `puzzle_input` into a list of lists which each inner list represents the
-# beacons detected by scanner coresponding to the inner list's index in the outer list.
-beacons_seen_by_scanners = [
-    np.array(
-        [
-            list(map(int, coordinates.split(",")))
-            # Remove the first line with `[1:]` since it simply contains the id of the
-            # scanner like so: `--- scanner 0 ---`.
-            for coordinates in scanner.split("\n")[1:]
-        ]
-    )
-    for scanner in puzzle_input
-]
+
+
+def parse(text):
+    # Parse the puzzle input into a list of lists which each inner list represents the
+    # beacons detected by scanner coresponding to the inner list's index in the outer
+    # list.
+    return [
+        np.array(
+            [
+                list(map(int, coordinates.split(",")))
+                # Remove the first line with `[1:]` since it simply contains the id of
+                # the scanner like so: `--- scanner 0 ---`.
+                for coordinates in scanner.split("\n")[1:]
+            ]
+        )
+        for scanner in text.strip().split("\n\n")
+    ]
 
 
 def rotations():
@@ -38,7 +37,14 @@ def rotations():
         for vj in vectors:
             if vi.dot(vj) == 0:
                 vk = np.cross(vi, vj)
-                yield lambda x: np.matmul(x, np.array([vi, vj, vk]))
+                # Bind the matrix as a default argument so each function keeps its
+                # own rotation after the loop moves on.
+                yield lambda x, matrix=np.array([vi, vj, vk]): np.matmul(x, matrix)
+
+
+# Build the rotation functions once instead of on every call to `fit`, so solving
+# several inputs in the same process reuses them.
+ROTATIONS = list(rotations())
 
 
 def get_beacon_distances(scanner_map):
@@ -99,7 +105,7 @@ def fit(
     `scanner_map_b`.
     """
     # For each of the 24 possible rotations...
-    for rotate in rotations():
+    for rotate in ROTATIONS:
         # Rotate `scanner_map_b` (the scanner map to be oriented correctly)
         scanner_map_b_rotated = rotate(scanner_map_b)
         # Loop through the two possible beacons for scanner B that could match with
@@ -131,6 +137,8 @@ def fit(
 
 
 def solve(beacons_seen_by_scanners):
+    # Copy the list since aligned scanner maps are written back into it below.
+    beacons_seen_by_scanners = list(beacons_seen_by_scanners)
     num_scanners = len(beacons_seen_by_scanners)
     scanner_positions = {0: np.array([0, 0, 0])}
     beacons = set(tuple(x) for x in beacons_seen_by_scanners[0])
@@ -204,24 +212,46 @@ def solve(beacons_seen_by_scanners):
     return scanner_positions.values(), beacons
 
 
-scanner_positions, beacons = solve(beacons_seen_by_scanners)
-# Calculate the total number of beacons for part 1.
-part1_solution = len(beacons)
-print(f"Part 1 Solution: {part1_solution}")
-
-largest_manhattan_distance = max(  # Find the largest distance out of all distances.
-    int(
-        cdist(  # `cdist` computes distance between two points.
-            np.reshape(
-                scanner_a_position, (-1, 3)
-            ),  # Reshape from 1D to 2D since `cdist` needs 2D.
-            np.reshape(scanner_b_position, (-1, 3)),
-            metric="cityblock",  # Use the Manhattan distance.
-        )[0][
-            0
-        ]  # Extract the actual value embedded within two nested lists.
-    )
-    # Loop through all the possible combinations of two scanner positions
-    for scanner_a_position, scanner_b_position in combinations(scanner_positions, 2)
-)
-print(f"Part 2 Solution: {largest_manhattan_distance}")
+# The parsed input that `solve_once` was last called with and the result of solving
+# it.
+_last_solved = (None, None)
+
+
+def solve_once(beacons_seen_by_scanners):
+    """Return `solve(beacons_seen_by_scanners)`, reusing the result of the previous
+    call when it was for the same parsed input, so aligning the scanners (by far the
+    slowest step) runs once for both parts rather than once per part.
+
+    Parsed inputs are compared by identity, which is enough since the parts never
+    modify them. Only the latest input is kept, so solving many inputs in one
+    process (`python -m aoc batch`) does not hold on to all of them.
+    """
+    global _last_solved
+    solved_input, result = _last_solved
+    if solved_input is not beacons_seen_by_scanners:
+        result = solve(beacons_seen_by_scanners)
+        _last_solved = (beacons_seen_by_scanners, result)
+    return result
+
+
+def part1(beacons_seen_by_scanners):
+    _, beacons = solve_once(beacons_seen_by_scanners)
+    # Calculate the total number of beacons for part 1.
+    return len(beacons)
+
+
+def part2(beacons_seen_by_scanners):
+    scanner_positions, _ = solve_once(beacons_seen_by_scanners)
+    scanner_positions = np.array(list(scanner_positions))
+    # Compute the Manhattan distance between every pair of scanner positions at once by
+    # broadcasting an (n, 1, 3) array against a (1, n, 3) array, then take the largest.
+    distances = np.abs(scanner_positions[:, None] - scanner_positions[None, :]).sum(-1)
+    return int(distances.max())
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        beacons_seen_by_scanners = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(beacons_seen_by_scanners)}")
+    print(f"Part 2 Solution: {part2(beacons_seen_by_scanners)}")
@@ -1,28 +1,154 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.strip().split() for line in puzzle_input]
-
-horizontal = 0
-depth = 0
-for command, amount in puzzle_input:
-    if command == "forward":
-        horizontal += int(amount)
-    elif command == "up":
-        depth -= int(amount)
-    elif command == "down":
-        depth += int(amount)
-
-print(f"Part 1 Solution: {horizontal*depth}")
-
-aim = 0
-horizontal = 0
-depth = 0
-for command, amount in puzzle_input:
-    if command == "forward":
-        horizontal += int(amount)
-        depth += int(amount) * aim
-    elif command == "up":
-        aim -= int(amount)
-    elif command == "down":
-        aim += int(amount)
-
-print(f"Part 2 Solution: {horizontal*depth}")
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from pathlib import Path
+
+# Allow running this file directly from inside `day_2` to import the shared `aoc`
+# package from the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.chunks import byte_ranges, read_range  # noqa: E402
+
+
+def parse(text):
+    return [
+        (command, int(amount))
+        for command, amount in (line.split() for line in text.strip().splitlines())
+    ]
+
+
+def part1(commands):
+    horizontal = 0
+    depth = 0
+    for command, amount in commands:
+        if command == "forward":
+            horizontal += amount
+        elif command == "up":
+            depth -= amount
+        elif command == "down":
+            depth += amount
+    return horizontal * depth
+
+
+def part2(commands):
+    aim = 0
+    horizontal = 0
+    depth = 0
+    for command, amount in commands:
+        if command == "forward":
+            horizontal += amount
+            depth += amount * aim
+        elif command == "up":
+            aim -= amount
+        elif command == "down":
+            aim += amount
+    return horizontal * depth
+
+
+# The vectorized and parallel solutions below summarize a run of commands as the
+# `(horizontal, depth, aim)` it produces when started from aim 0, where `depth` is
+# the part 2 depth. The part 1 depth is the same as the part 2 aim, so both parts can
+# be read off the summary of the whole course:
+#   part 1 = horizontal * aim
+#   part 2 = horizontal * depth
+
+
+def summarize(data):
+    """Summarize the commands in `data` (bytes) with NumPy.
+
+    Each "forward" adds the aim at that point times its amount to the depth, and the
+    aim at each command is a cumulative sum of the "down" and "up" amounts, so the
+    whole part 2 walk is one `cumsum` and one dot product.
+    """
+    import numpy as np
+
+    words = data.split()
+    if not words:
+        return 0, 0, 0
+    commands = np.array(words[0::2])
+    amounts = np.array(words[1::2], dtype=np.int64)
+    # The first letter of each command ("f", "d" or "u").
+    kinds = commands.view(np.uint8).reshape(len(commands), -1)[:, 0]
+    forward = np.where(kinds == ord("f"), amounts, 0)
+    aim_change = np.where(kinds == ord("d"), amounts, 0) - np.where(
+        kinds == ord("u"), amounts, 0
+    )
+    aim = np.cumsum(aim_change)
+    return int(forward.sum()), int(np.dot(forward, aim)), int(aim[-1])
+
+
+def combine(first, second):
+    """Combine the summaries of two consecutive runs of commands.
+
+    The second run started with the aim the first run ended with rather than 0, so
+    each of its "forward" commands goes `first_aim` deeper than its summary says.
+    Combining is associative, so chunks can be summarized in any grouping.
+    """
+    horizontal1, depth1, aim1 = first
+    horizontal2, depth2, aim2 = second
+    return (
+        horizontal1 + horizontal2,
+        depth1 + depth2 + aim1 * horizontal2,
+        aim1 + aim2,
+    )
+
+
+def _summarize_range(path, start, end):
+    """Summarize the lines of `path` that start in the byte range `[start, end)`."""
+    return summarize(read_range(path, start, end))
+
+
+def solve_file(path, workers=1, chunk_size=2**26):
+    """Solve both parts for a (possibly huge) command log by summarizing chunks of
+    `chunk_size` bytes and combining the summaries in order. With more than one
+    worker the chunks are summarized in parallel processes.
+
+    Chunking also keeps the 64-bit NumPy sums within a chunk far from overflowing;
+    the summaries are combined with Python integers.
+
+    Returns:
+        tuple: The part 1 and part 2 answers.
+    """
+    starts, ends = byte_ranges(path, chunk_size)
+    paths = [path] * len(starts)
+    if workers == 1:
+        summaries = map(_summarize_range, paths, starts, ends)
+        horizontal, depth, aim = reduce(combine, summaries, (0, 0, 0))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = executor.map(_summarize_range, paths, starts, ends)
+            horizontal, depth, aim = reduce(combine, summaries, (0, 0, 0))
+    return horizontal * aim, horizontal * depth
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plot the submarine's course.")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default="puzzle_input.txt",
+        help="The planned course (default: puzzle_input.txt).",
+    )
+    parser.add_argument(
+        "--numpy",
+        action="store_true",
+        help="Solve both parts with NumPy cumulative sums, reading the file in "
+        "chunks.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Summarize the chunks in this many processes (implies --numpy).",
+    )
+    args = parser.parse_args()
+
+    if args.numpy or args.workers:
+        part1_solution, part2_solution = solve_file(args.input, args.workers or 1)
+    else:
+        with open(args.input, "r") as puzzle_input:
+            commands = parse(puzzle_input.read())
+        part1_solution, part2_solution = part1(commands), part2(commands)
+
+    print(f"Part 1 Solution: {part1_solution}")
+    print(f"Part 2 Solution: {part2_solution}")
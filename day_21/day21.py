@@ -2,10 +2,10 @@ from functools import cache
 from itertools import product
 from collections import Counter
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.strip() for line in puzzle_input]
 
-position1, position2 = [int(x.split()[-1]) for x in puzzle_input]
+def parse(text):
+    position1, position2 = [int(x.split()[-1]) for x in text.strip().splitlines()]
+    return position1, position2
 
 
 def run_part1_turn(position, num_die_rolls):
@@ -22,7 +22,7 @@ def run_part1_turn(position, num_die_rolls):
     return position, num_die_rolls
 
 
-def part1(position1, position2):
+def play_deterministic(position1, position2):
     num_die_rolls = 0
     # Each player has a list with two elements: their current position and score.
     players = [[position1, 0], [position2, 0]]
@@ -41,8 +41,9 @@ def part1(position1, position2):
                 return min(players[0][1], players[1][1]) * num_die_rolls
 
 
-part1_solution = part1(position1, position2)
-print(f"Part 1 Solution: {part1_solution}")
+def part1(positions):
+    return play_deterministic(*positions)
+
 
 # The next line creates the following list:
 # `[(6, 7), (5, 6), (7, 6), (4, 3), (8, 3), (3, 1), (9, 1)]`.
@@ -53,9 +54,10 @@ sum_possibilities = Counter(
     sum(r) for r in product(range(1, 4), repeat=3)
 ).most_common()
 
+
 # `@cache` is a feature of Python 3.9+ that implemented dictionary based memoization.
 @cache
-def part2(position1, position2, score1=0, score2=0):
+def count_wins(position1, position2, score1=0, score2=0):
     # If the score of the previously updated player is 21 or greater, then the game is
     # over. Return 0 for the losing player and for the winning player so each player
     # gets the correct number of wins.
@@ -67,10 +69,10 @@ def part2(position1, position2, score1=0, score2=0):
         # Use the same logic from part 1 to set a score of a multiple of 10 to 10
         # instead of 0.
         position1_updated = (position1 + roll) % 10 or 10
-        # Swap the player's positions and scores with each call to `part2`. This means
-        # the each call to the function only has to update one player since then next
-        # call will update the other player.
-        new_wins2, new_wins1 = part2(
+        # Swap the player's positions and scores with each call to `count_wins`. This
+        # means the each call to the function only has to update one player since then
+        # next call will update the other player.
+        new_wins2, new_wins1 = count_wins(
             position2, position1_updated, score2, score1 + position1_updated
         )
         # Compute the number of wins by adding to the previous number of wins the
@@ -82,5 +84,13 @@ def part2(position1, position2, score1=0, score2=0):
     return wins1, wins2
 
 
-part2_solution = max(part2(position1, position2))
-print(f"Part 2 Solution: {part2_solution}")
+def part2(positions):
+    return max(count_wins(*positions))
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        positions = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(positions)}")
+    print(f"Part 2 Solution: {part2(positions)}")
@@ -1,8 +1,9 @@
 import re
 from collections import defaultdict
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.strip().split() for line in puzzle_input]
+
+def parse(text):
+    return [line.split() for line in text.strip().splitlines()]
 
 
 def intersect(nx0, nx1, ny0, ny1, nz0, nz1, ox0, ox1, oy0, oy1, oz0, oz1):
@@ -21,14 +22,14 @@ def intersect(nx0, nx1, ny0, ny1, nz0, nz1, ox0, ox1, oy0, oy1, oz0, oz1):
     return None
 
 
-def solve(part1=False):
+def solve(reboot_steps, part1=False):
     cubes = defaultdict(int)
-    for on_off, coordinates in puzzle_input:
+    for on_off, coordinates in reboot_steps:
         # Convert `on_off` from a `str` to a `bool` indicating if this cuboid is "on".
         on_off = on_off == "on"
         # `-?\d+` matches 0 or 1 "-" characters and then matches 1 or more digit
         # characters (0-9). Convert all matches to an integer using `map(int, ...)`.
-        new_coords = tuple(map(int, re.findall("-?\d+", coordinates)))
+        new_coords = tuple(map(int, re.findall(r"-?\d+", coordinates)))
         # If we are solving part 1, then break the loop and return immediately if any
         # of the new coordinates are outside a 50x50x50 region centered at (0,0).
         if part1 and any([abs(x) > 50 for x in new_coords]):
@@ -82,7 +83,17 @@ def solve(part1=False):
     )
 
 
-part1_solution = solve(part1=True)
-print(f"Part 1 Solution: {part1_solution}")
-part2_solution = solve(part1=False)
-print(f"Part 2 Solution: {part2_solution}")
+def part1(reboot_steps):
+    return solve(reboot_steps, part1=True)
+
+
+def part2(reboot_steps):
+    return solve(reboot_steps, part1=False)
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        reboot_steps = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(reboot_steps)}")
+    print(f"Part 2 Solution: {part2(reboot_steps)}")
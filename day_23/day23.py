@@ -1,8 +1,5 @@
 from functools import cache  # Requires Python 3.9+
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [line.rstrip() for line in puzzle_input]
-
 costs = {
     "A": 1,
     "B": 10,
@@ -182,6 +179,10 @@ def steps_to_final(state, target_state):
     return min(possible_costs)
 
 
+def parse(text):
+    return text.rstrip().splitlines()
+
+
 def initialize(puzzle_input):
     puzzle_input = [[line[idx] for idx in (3, 5, 7, 9)] for line in puzzle_input[2:-1]]
     # `state1` for my part 1 input is:
@@ -195,12 +196,23 @@ def initialize(puzzle_input):
     return starting_state, target_state
 
 
-starting_state, target_state = initialize(puzzle_input)
-part1_solution = steps_to_final(starting_state, target_state)
-print(f"Part 1 Solution: {part1_solution}")
+def part1(burrow):
+    starting_state, target_state = initialize(burrow)
+    return steps_to_final(starting_state, target_state)
+
+
+def part2(burrow):
+    # Unfold the diagram by inserting the two extra lines given by the challenge.
+    burrow = burrow.copy()
+    burrow.insert(3, "  #D#C#B#A#")
+    burrow.insert(4, "  #D#B#A#C#")
+    starting_state, target_state = initialize(burrow)
+    return steps_to_final(starting_state, target_state)
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        burrow = parse(puzzle_input.read())
 
-puzzle_input.insert(3, "  #D#C#B#A#")
-puzzle_input.insert(4, "  #D#B#A#C#")
-starting_state, target_state = initialize(puzzle_input)
-part2_solution = steps_to_final(starting_state, target_state)
-print(f"Part 2 Solution: {part2_solution}")
+    print(f"Part 1 Solution: {part1(burrow)}")
+    print(f"Part 2 Solution: {part2(burrow)}")
@@ -1,62 +1,92 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [list(line.strip()) for line in puzzle_input]
+import re
+import sys
+from array import array
+from pathlib import Path
 
-height = len(puzzle_input)
-width = len(puzzle_input[0])
+# Allow running this file directly from inside `day_25` to import the shared `aoc`
+# package from the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from aoc.grid import Grid  # noqa: E402
+
+# The grid stores the byte value of each character.
+EAST, SOUTH, EMPTY = b">v."
+# A sea cucumber moves if the cell in front of it is empty. `re.subn` replaces
+# non-overlapping matches, so in ">>." only the second sea cucumber moves, exactly as
+# if all the sea cucumbers in the herd moved simultaneously.
+east_move = re.compile(rb">\.")
+south_move = re.compile(rb"v\.")
+
+
+def parse(text):
+    return Grid.from_lines(text)
 
-def run_east(grid):
-    moves = []
-    # Loop over each element in the grid.
-    for row_idx, row in enumerate(grid):
-        for col_idx, value in enumerate(row):
-            # If the value in the grid is east and the destination cell is empty, then
-            # append these grid coordinates as a sea cucumber that can move.
-            # `(col_idx + 1) % width` will wrap around to the other side of the grid
-            # in the same row if the current sea cucumber is on the edge of the grid.
-            if value == ">" and row[(col_idx + 1) % width] == ".":
-                moves.append((row_idx, col_idx))
-
-    # For each set of coordinates in `moves`, set the position to "empty," and set the
-    # sea cucumber's destination to its representation symbol.
-    for row_idx, col_idx in moves:
-        grid[row_idx][col_idx] = "."
-        grid[row_idx][(col_idx + 1) % width] = ">"
 
+def move_line(line, pattern, herd):
+    """Move the `herd` sea cucumbers one step forward along `line` (a row for the
+    east facing herd or a column for the south facing herd) and return the new line
+    and the number of sea cucumbers that moved.
+    """
+    # A sea cucumber at the end of the line wraps around to the start. Check this on
+    # the original line since all the sea cucumbers move at the same time.
+    wraps = line[-1] == herd and line[0] == EMPTY
+    line, num_moves = pattern.subn(bytes([EMPTY, herd]), line)
+    if wraps:
+        line = bytes([herd]) + line[1:-1] + bytes([EMPTY])
+        num_moves += 1
+    return line, num_moves
+
+
+def run_east(grid):
+    num_moves = 0
+    # Move each row in place using zero-copy views of the grid's rows.
+    for row in grid.rows():
+        new_row, row_num_moves = move_line(row.tobytes(), east_move, EAST)
+        if row_num_moves:
+            row[:] = new_row
+            num_moves += row_num_moves
     # Return the new `grid` and the number of moves completed.
-    return grid, len(moves)
+    return grid, num_moves
 
 
 def run_south(grid):
     # Does the exact same actions as `run_east()` but for the southern moving sea
-    # cucumbers. These sea cucumbers wrap from the bottom to the top of the grid
-    # and use the symbol `v` instead of `>`.
-    moves = []
-    for row_idx, row in enumerate(grid):
-        for col_idx, value in enumerate(row):
-            if value == "v" and grid[(row_idx + 1) % height][col_idx] == ".":
-                moves.append((row_idx, col_idx))
+    # cucumbers, which wrap from the bottom to the top of each column and use the
+    # symbol `v` instead of `>`. Columns are every `width`-th cell of the flat grid.
+    cells = grid.cells
+    width = grid.width
+    num_moves = 0
+    for col_idx in range(width):
+        column = cells[col_idx::width]
+        new_column, column_num_moves = move_line(column.tobytes(), south_move, SOUTH)
+        if column_num_moves:
+            cells[col_idx::width] = array(cells.typecode, new_column)
+            num_moves += column_num_moves
+    return grid, num_moves
 
-    for row_idx, col_idx in moves:
-        grid[row_idx][col_idx] = "."
-        grid[(row_idx + 1) % height][col_idx] = "v"
 
-    return grid, len(moves)
+def part1(grid):
+    # Copy the grid since `run_east` and `run_south` move sea cucumbers in place.
+    grid = grid.copy()
+    step = 0
+    current_step_num_moves = -1
+    # Keep looping until the number of moves performed in a single step is zero, which
+    # indicates that none of the sea cucumbers moved in that step.
+    while current_step_num_moves != 0:
+        # First, move the eastward facing sea cucumbers.
+        grid, num_moves = run_east(grid)
+        current_step_num_moves = num_moves
+        # Then, move the southward facing sea cucumbers.
+        grid, num_moves = run_south(grid)
+        current_step_num_moves += num_moves
 
+        step += 1
 
-step = 0
-current_step_num_moves = -1
-# Keep looping until the number of moves performed in a single step is zero, which
-# indicates that none of the sea cucumbers moved in that step.
-while current_step_num_moves != 0:
-    # First, move the eastward facing sea cucumbers.
-    puzzle_input, num_moves = run_east(puzzle_input)
-    current_step_num_moves = num_moves
-    # Then, move the southward facing sea cucumbers.
-    puzzle_input, num_moves = run_south(puzzle_input)
-    current_step_num_moves += num_moves
+    return step
 
-    step += 1
 
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        grid = parse(puzzle_input.read())
 
-print(f"Part 1 Solution: {step}")
+    print(f"Part 1 Solution: {part1(grid)}")
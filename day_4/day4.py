@@ -1,61 +1,132 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
-
-# Parse input into lists
-puzzle_input = puzzle_input.split("\n\n")
-draw_order = puzzle_input[0].split(",")
-boards = [[y.split() for y in x.split("\n")] for x in puzzle_input[1:]]
-
-
-def get_board_score(final_board, numbers_drawn):
-    # Flatten final board
-    final_board_flat = [item for sublist in final_board for item in sublist]
-    # Sum the board values that were not called
-    sum_unmarked = sum(int(x) for x in final_board_flat if x not in numbers_drawn)
-    return sum_unmarked * int(numbers_drawn[-1])
-
-
-def get_winning_board(draw_order, boards):
-    numbers_drawn = []
-    for number_drawn in draw_order:
-        numbers_drawn.append(number_drawn)
-        for board in boards:
-            # zip(*board) is transposed board matrix
-            for row, column in zip(board, zip(*board)):
-                # If all the values in a single row or column are in the list of
-                # numbers drawn, then the board is a winner.
-                if all([x in numbers_drawn for x in row]) or all(
-                    [x in numbers_drawn for x in column]
-                ):
-                    return board, numbers_drawn
-
-
-winning_board, numbers_drawn = get_winning_board(draw_order, boards)
-part1_solution = get_board_score(winning_board, numbers_drawn)
-print(f"Part 1 Solution: {part1_solution}")
-
-
-def get_last_winning_board(draw_order, boards):
-    numbers_drawn = []
-    for number_drawn in draw_order:
-        numbers_drawn.append(number_drawn)
-        boards_to_remove = []
-        for board in boards:
-            # zip(*board) is transposed board matrix
-            for row, column in zip(board, zip(*board)):
-                # If all the values in a single row or column are in the list of
-                # numbers drawn, then the board is a winner and it should be removed.
-                if all([x in numbers_drawn for x in row]) or all(
-                    [x in numbers_drawn for x in column]
-                ):
-                    boards_to_remove.append(board)
-                    if len(boards) == 1:  # only one board left, must be losing board
-                        return boards[0], numbers_drawn
-                    break  # no need to continue checking board if it already won
-        # Remove winning boards
-        boards = [x for x in boards if x not in boards_to_remove]
-
-
-last_winning_board, numbers_drawn = get_last_winning_board(draw_order, boards)
-part2_solution = get_board_score(last_winning_board, numbers_drawn)
-print(f"Part 2 Solution: {part2_solution}")
+from collections import defaultdict
+
+# Importing NumPy takes about 110 ms. `win_order` costs about 18 µs per board and
+# `win_order_numpy` about 4.5 µs (17.6 ms vs 4.5 ms for 1,000 boards), and both parts
+# call it, so the NumPy version only wins from roughly 4,000 boards.
+NUMPY_MIN_BOARDS = 5_000
+
+
+def parse(text):
+    # Parse input into lists
+    sections = text.strip().split("\n\n")
+    draw_order = [int(x) for x in sections[0].split(",")]
+    boards = [
+        [[int(z) for z in y.split()] for y in x.split("\n")] for x in sections[1:]
+    ]
+    return draw_order, boards
+
+
+def unmarked_sum(board, draw_times, win_time):
+    # The numbers that were not drawn by `win_time` (or never) are unmarked.
+    return sum(
+        number
+        for row in board
+        for number in row
+        if draw_times.get(number, win_time + 1) > win_time
+    )
+
+
+def win_order(draw_order, boards):
+    """Play every board in a single pass over `draw_order`.
+
+    Each number is indexed to the `(board, row, column)` cells it appears in, and
+    each board keeps a count of the marked cells in each row and column, so drawing
+    a number only touches the cells with that number.
+
+    Returns:
+        list: `(board_index, draw_index, score)` for each board that wins, in the order
+        they win. Boards that win on the same draw are ordered by index. Boards that
+        never win are left out.
+    """
+    if len(boards) >= NUMPY_MIN_BOARDS:
+        return win_order_numpy(draw_order, boards)
+
+    cells = defaultdict(list)
+    for board_index, board in enumerate(boards):
+        for row_index, row in enumerate(board):
+            for column_index, number in enumerate(row):
+                cells[number].append((board_index, row_index, column_index))
+
+    num_rows, num_columns = len(boards[0]), len(boards[0][0])
+    row_hits = [[0] * num_rows for _ in boards]
+    column_hits = [[0] * num_columns for _ in boards]
+    won = [False] * len(boards)
+    draw_times = {}
+    order = []
+    for draw_index, number in enumerate(draw_order):
+        if number in draw_times:
+            # Drawing a number again does not mark anything new.
+            continue
+        draw_times[number] = draw_index
+        for board_index, row_index, column_index in cells.get(number, ()):
+            if won[board_index]:
+                continue
+            row_hits[board_index][row_index] += 1
+            column_hits[board_index][column_index] += 1
+            if (
+                row_hits[board_index][row_index] == num_columns
+                or column_hits[board_index][column_index] == num_rows
+            ):
+                won[board_index] = True
+                order.append((board_index, draw_index))
+
+    return [
+        (
+            board_index,
+            draw_index,
+            unmarked_sum(boards[board_index], draw_times, draw_index)
+            * draw_order[draw_index],
+        )
+        for board_index, draw_index in order
+    ]
+
+
+def win_order_numpy(draw_order, boards):
+    """The same as `win_order`, but batched over all boards with NumPy.
+
+    Instead of drawing the numbers one at a time, look up when each cell is marked.
+    A row (or column) is complete when its last cell is marked, and a board wins
+    when its first row or column is complete.
+    """
+    import numpy as np
+
+    boards = np.array(boards)
+    draw_order = np.array(draw_order)
+    never = len(draw_order)
+    # `draw_times[number]` is the index of the draw that marks `number`.
+    draw_times = np.full(max(boards.max(), draw_order.max()) + 1, never)
+    # Assign in reverse so a number drawn twice keeps its first draw.
+    draw_times[draw_order[::-1]] = np.arange(never)[::-1]
+    # An array with the same shape as `boards` of when each cell is marked.
+    cell_times = draw_times[boards]
+    win_times = np.minimum(
+        cell_times.max(axis=2).min(axis=1), cell_times.max(axis=1).min(axis=1)
+    )
+    # A stable sort keeps boards that win on the same draw in order of index.
+    order = np.argsort(win_times, kind="stable")
+    order = order[win_times[order] < never]
+    unmarked = np.where(cell_times > win_times[:, None, None], boards, 0).sum(
+        axis=(1, 2)
+    )
+    scores = unmarked[order] * draw_order[win_times[order]]
+    return list(zip(order.tolist(), win_times[order].tolist(), scores.tolist()))
+
+
+def part1(bingo):
+    draw_order, boards = bingo
+    _, _, score = win_order(draw_order, boards)[0]
+    return score
+
+
+def part2(bingo):
+    draw_order, boards = bingo
+    _, _, score = win_order(draw_order, boards)[-1]
+    return score
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        bingo = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(bingo)}")
+    print(f"Part 2 Solution: {part2(bingo)}")
@@ -1,9 +1,27 @@
+import math
+from bisect import bisect_left, bisect_right, insort
 from collections import defaultdict
+from itertools import combinations
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [
-        [[int(y) for y in x.split(",")] for x in line.strip().split(" -> ")]
-        for line in puzzle_input
+# Rasterize with NumPy once the lines cover this many points in total. Below that,
+# stepping through the points in Python is faster than importing NumPy.
+NUMPY_MIN_POINTS = 100_000
+# The largest bounding box (in cells) counted on a dense grid. Larger vent maps are
+# counted with a sorted, sparse list of the points instead.
+DENSE_MAX_CELLS = 2**23
+# How many points to generate at once, to bound the memory used by long lines.
+BATCH_POINTS = 2**22
+# Solve from the geometry of the lines, without visiting their points, once the
+# lines are this many points long on average. Every crossing is also a point on the
+# lines, so `solve_analytic` never does more work than rasterizing, but each crossing
+# costs far more in Python than each point costs NumPy.
+ANALYTIC_MIN_POINTS_PER_LINE = 1000
+
+
+def parse(text):
+    return [
+        [[int(y) for y in x.split(",")] for x in line.split(" -> ")]
+        for line in text.strip().splitlines()
     ]
 
 
@@ -37,8 +55,268 @@ def solve(puzzle_input, count_diagonals=False):
     return sum(1 for v in points.values() if v >= 2)
 
 
-part1_solution = solve(puzzle_input, count_diagonals=False)
-print(f"Part 1 Solution: {part1_solution}")
+def line_batches(np, lines, lengths):
+    """Split `lines` into batches of whole lines with about `BATCH_POINTS` points."""
+    batch_ends = np.cumsum(lengths) // BATCH_POINTS
+    boundaries = np.flatnonzero(np.diff(batch_ends)) + 1
+    for indices in np.split(np.arange(len(lines)), boundaries):
+        if len(indices):
+            yield lines[indices], lengths[indices]
+
+
+def rasterize(np, lines, lengths):
+    """Return the x and y coordinates of every point on each of `lines`."""
+    x1, y1, x2, y2 = lines.T
+    # The line each point belongs to, and how many steps it is from the line's start.
+    line_ids = np.repeat(np.arange(len(lines)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    steps = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+    xs = x1[line_ids] + np.sign(x2 - x1)[line_ids] * steps
+    ys = y1[line_ids] + np.sign(y2 - y1)[line_ids] * steps
+    return xs, ys
+
+
+def solve_numpy(puzzle_input, count_diagonals=False):
+    """The same as `solve`, but generates the points of the lines in bulk with NumPy
+    and counts them on a dense grid with `np.bincount`, or by sorting the encoded
+    points when the bounding box of the lines is too large for a dense grid.
+    """
+    import numpy as np
+
+    lines = np.array(puzzle_input, dtype=np.int64).reshape(-1, 4)
+    x1, y1, x2, y2 = lines.T
+    if not count_diagonals:
+        lines = lines[(x1 == x2) | (y1 == y2)]
+        x1, y1, x2, y2 = lines.T
+    if not len(lines):
+        return 0
+    lengths = np.maximum(abs(x2 - x1), abs(y2 - y1)) + 1
+    # Shift the coordinates so they start at 0 and encode each point as one integer.
+    min_x, min_y = min(x1.min(), x2.min()), min(y1.min(), y2.min())
+    width = max(x1.max(), x2.max()) - min_x + 1
+    height = max(y1.max(), y2.max()) - min_y + 1
+    lines = lines - [min_x, min_y, min_x, min_y]
+
+    if width * height <= DENSE_MAX_CELLS:
+        counts = np.zeros(width * height, dtype=np.int64)
+        for batch, batch_lengths in line_batches(np, lines, lengths):
+            xs, ys = rasterize(np, batch, batch_lengths)
+            # `bincount` is much faster than `np.add.at` for accumulating repeated
+            # indices.
+            counts += np.bincount(ys * width + xs, minlength=width * height)
+        return int(np.count_nonzero(counts >= 2))
+
+    # Count the points of each batch by sorting them, then merge the counts of the
+    # distinct points of all batches the same way.
+    points, counts = [], []
+    for batch, batch_lengths in line_batches(np, lines, lengths):
+        xs, ys = rasterize(np, batch, batch_lengths)
+        batch_points, batch_counts = np.unique(ys * width + xs, return_counts=True)
+        points.append(batch_points)
+        counts.append(batch_counts)
+    _, point_ids = np.unique(np.concatenate(points), return_inverse=True)
+    totals = np.bincount(point_ids, weights=np.concatenate(counts))
+    return int(np.count_nonzero(totals >= 2))
+
+
+# The four directions a line can have, as the coefficients `(a, b)` of the quantity
+# `a * x + b * y` that is the same at every point of a line in that family (its
+# "key"). Each point of a line is identified by its key and by a parameter `t` along
+# the line.
+FAMILIES = {
+    "horizontal": (0, 1),  # y is constant, t = x
+    "vertical": (1, 0),  # x is constant, t = y
+    "diagonal": (-1, 1),  # y - x is constant, t = x
+    "antidiagonal": (1, 1),  # y + x is constant, t = x
+}
+
+
+def family_key(family, x, y):
+    a, b = FAMILIES[family]
+    return a * x + b * y
+
+
+def family_parameter(family, x, y):
+    return y if family == "vertical" else x
+
+
+def family_point(family, key, t):
+    """Return the `(x, y)` point with parameter `t` on the line `key` of `family`."""
+    if family == "horizontal":
+        return t, key
+    if family == "vertical":
+        return key, t
+    if family == "diagonal":
+        return t, key + t
+    return t, key - t
+
+
+def merge_intervals(intervals):
+    """Return the union and the parts covered at least twice of the inclusive
+    integer `intervals`, both as sorted lists of disjoint `(start, end)` tuples.
+    """
+    # Coverage goes up at each start and down one past each end.
+    events = sorted(
+        [(start, 1) for start, _ in intervals] + [(end + 1, -1) for _, end in intervals]
+    )
+    union, doubles = [], []
+    coverage = 0
+    for position, change in events:
+        if coverage == 0 and change == 1:
+            union_start = position
+        elif coverage == 1 and change == -1:
+            union.append((union_start, position - 1))
+        if coverage == 1 and change == 1:
+            double_start = position
+        elif coverage == 2 and change == -1:
+            doubles.append((double_start, position - 1))
+        coverage += change
+    # Join touching runs, which the events split when one interval ends right where
+    # the next one starts.
+    return _join(union), _join(doubles)
+
+
+def _join(intervals):
+    joined = []
+    for start, end in intervals:
+        if joined and start <= joined[-1][1] + 1:
+            joined[-1] = (joined[-1][0], max(joined[-1][1], end))
+        elif start <= end:
+            joined.append((start, end))
+    return joined
+
+
+def _contains(intervals, t):
+    """Whether `t` is inside one of the sorted, disjoint `(start, end)` `intervals`."""
+    index = bisect_right(intervals, (t, math.inf)) - 1
+    return index >= 0 and intervals[index][1] >= t
+
+
+def crossings(family1, lines1, family2, lines2):
+    """Yield the lattice points where a line of `family1` crosses a line of
+    `family2`, given each family's lines as `{key: [(start, end), ...]}`.
+
+    In the coordinates `(u, v) = (key of family2, key of family1)` the lines of
+    `family1` are horizontal and those of `family2` are vertical, so this is a sweep
+    over `u` that keeps the `family1` lines crossing the sweep line in a sorted list
+    and looks up each `family2` line's range of `v` in it. This takes time
+    proportional to the number of lines plus crossings (up to the log factors of the
+    bisections), however long the lines are.
+    """
+    (a1, b1), (a2, b2) = FAMILIES[family1], FAMILIES[family2]
+    determinant = a1 * b2 - b1 * a2
+    # Events at the same `u` are ordered: start a line, check crossings, end a line.
+    events = []
+    for v, intervals in lines1.items():
+        for start, end in intervals:
+            u1 = family_key(family2, *family_point(family1, v, start))
+            u2 = family_key(family2, *family_point(family1, v, end))
+            events.append((min(u1, u2), 0, v))
+            events.append((max(u1, u2), 2, v))
+    for u, intervals in lines2.items():
+        for start, end in intervals:
+            v1 = family_key(family1, *family_point(family2, u, start))
+            v2 = family_key(family1, *family_point(family2, u, end))
+            events.append((u, 1, (min(v1, v2), max(v1, v2))))
+    events.sort(key=lambda event: event[:2])
+
+    # Merged lines with the same key never overlap, so each `v` is active at most once.
+    active = []
+    for u, kind, value in events:
+        if kind == 0:
+            insort(active, value)
+        elif kind == 2:
+            active.pop(bisect_left(active, value))
+        else:
+            low, high = value
+            for v in active[bisect_left(active, low) : bisect_right(active, high)]:
+                # Solve `a1 * x + b1 * y = v` and `a2 * x + b2 * y = u`. The diagonals
+                # cross halfway between lattice points when `u` and `v` have different
+                # parities, so skip those.
+                x, x_remainder = divmod(v * b2 - b1 * u, determinant)
+                y, y_remainder = divmod(a1 * u - a2 * v, determinant)
+                if not x_remainder and not y_remainder:
+                    yield x, y
+
+
+def solve_analytic(puzzle_input, count_diagonals=False):
+    """The same as `solve`, but computed from the geometry of the lines, so the time
+    depends on the number of lines and crossings rather than on how long they are.
+
+    Lines in the same family (direction) only overlap if they have the same key, and
+    then they overlap along an interval, so sweeping each key's intervals gives the
+    points covered twice within a family. Lines in different families cross in at
+    most one point, so the points covered by two or more families are found by
+    enumerating the crossings of each pair of families (see `crossings`).
+    """
+    segments = {family: defaultdict(list) for family in FAMILIES}
+    for (x1, y1), (x2, y2) in puzzle_input:
+        if x1 == x2:
+            family = "vertical"
+        elif y1 == y2:
+            family = "horizontal"
+        elif not count_diagonals:
+            continue
+        elif (x2 - x1) == (y2 - y1):
+            family = "diagonal"
+        else:
+            family = "antidiagonal"
+        t1, t2 = family_parameter(family, x1, y1), family_parameter(family, x2, y2)
+        key = family_key(family, x1, y1)
+        segments[family][key].append((min(t1, t2), max(t1, t2)))
+
+    unions = {family: {} for family in FAMILIES}
+    doubles = {family: {} for family in FAMILIES}
+    total = 0
+    for family, lines in segments.items():
+        for key, intervals in lines.items():
+            unions[family][key], doubles[family][key] = merge_intervals(intervals)
+            total += sum(end - start + 1 for start, end in doubles[family][key])
+
+    # Every point covered by two or more families counts once, but `total` already
+    # counted it once for each family that covers it twice on its own.
+    multi_family_points = set()
+    for family1, family2 in combinations(FAMILIES, 2):
+        multi_family_points.update(
+            crossings(family1, unions[family1], family2, unions[family2])
+        )
+    for x, y in multi_family_points:
+        counted = sum(
+            _contains(
+                doubles[family].get(family_key(family, x, y), ()),
+                family_parameter(family, x, y),
+            )
+            for family in FAMILIES
+        )
+        total += 1 - counted
+    return total
+
+
+def count_overlaps(vent_lines, count_diagonals=False):
+    """Count the points where at least two lines overlap, choosing the fastest solver
+    for the number and length of the lines.
+    """
+    num_points = sum(
+        max(abs(x2 - x1), abs(y2 - y1)) + 1 for (x1, y1), (x2, y2) in vent_lines
+    )
+    if num_points >= ANALYTIC_MIN_POINTS_PER_LINE * len(vent_lines):
+        return solve_analytic(vent_lines, count_diagonals)
+    if num_points >= NUMPY_MIN_POINTS:
+        return solve_numpy(vent_lines, count_diagonals)
+    return solve(vent_lines, count_diagonals)
+
+
+def part1(vent_lines):
+    return count_overlaps(vent_lines, count_diagonals=False)
+
+
+def part2(vent_lines):
+    return count_overlaps(vent_lines, count_diagonals=True)
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        vent_lines = parse(puzzle_input.read())
 
-part2_solution = solve(puzzle_input, count_diagonals=True)
-print(f"Part 1 Solution: {part2_solution}")
+    print(f"Part 1 Solution: {part1(vent_lines)}")
+    print(f"Part 2 Solution: {part2(vent_lines)}")
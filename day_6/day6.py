@@ -1,9 +1,13 @@
+import argparse
 from collections import Counter, defaultdict
+from functools import cache, partial
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
 
-initial_state = [int(x) for x in puzzle_input.split(",")]
+def parse(text):
+    initial_state = [int(x) for x in text.strip().split(",")]
+    # Count the number of fish at each age
+    return Counter(initial_state)
+
 
 # My slow initial approach used for part 1:
 # current_state = initial_state
@@ -14,8 +18,6 @@ initial_state = [int(x) for x in puzzle_input.split(",")]
 #     current_state = new_state
 # print(f"Part 1 Solution: {len(current_state)}")
 
-# Count the number of fish at each age
-age_to_count = Counter(initial_state)
 
 def simulate_days(num_days, age_to_count):
     for _ in range(num_days):
@@ -33,9 +35,129 @@ def simulate_days(num_days, age_to_count):
                 new_fish[8] += count
         # Store the `new_fish` for the next iteration/day
         age_to_count = new_fish
-    
+
     # The number of fish is the sum of the number of fish at each age
     return sum(age_to_count.values())
 
-print(f"Part 1 Solution: {simulate_days(80, age_to_count)}")
-print(f"Part 2 Solution: {simulate_days(256, age_to_count)}")
+
+# `simulate_days` takes time proportional to the number of days. Since each day maps
+# the counts of fish at each age linearly to the next day's counts, `num_days` days
+# are instead one multiplication by the `num_days`-th power of a 9x9 transition
+# matrix, which takes O(log(num_days)) matrix products by repeated squaring.
+# `TRANSITION[new_age][age]` is how many fish of `new_age` one fish of `age` becomes
+# the next day.
+TRANSITION = [[0] * 9 for _ in range(9)]
+for age in range(1, 9):
+    TRANSITION[age - 1][age] = 1
+# Fish with a timer of 0 reset to 6 and spawn a new fish with a timer of 8.
+TRANSITION[6][0] = 1
+TRANSITION[8][0] = 1
+
+
+def multiply(first, second, modulus=None):
+    """Multiply two matrices (lists of rows) of Python ints, optionally modulo
+    `modulus`."""
+    product = [
+        [sum(a * b for a, b in zip(row, column)) for column in zip(*second)]
+        for row in first
+    ]
+    if modulus is not None:
+        product = [[value % modulus for value in row] for row in product]
+    return product
+
+
+@cache
+def transition_power_of_two(exponent, modulus=None):
+    """Return `TRANSITION` to the power of `2**exponent`. The powers are cached, so a
+    batch of projections for different numbers of days shares them."""
+    if exponent == 0:
+        return TRANSITION
+    half = transition_power_of_two(exponent - 1, modulus)
+    return multiply(half, half, modulus)
+
+
+def fish_per_age(num_days, modulus=None):
+    """Return how many fish a single fish of each age becomes after `num_days` days.
+
+    This is the row vector of ones times `TRANSITION ** num_days`, built from the
+    cached powers of two for the bits set in `num_days`. The result itself is not
+    cached, since exact counts for large `num_days` are huge and only take
+    O(log(num_days)) vector products to compute again.
+    """
+    weights = [[1] * 9]
+    bit = 0
+    while num_days:
+        if num_days & 1:
+            weights = multiply(weights, transition_power_of_two(bit, modulus), modulus)
+        num_days >>= 1
+        bit += 1
+    return weights[0]
+
+
+def total_fish(age_to_count, weights, modulus=None):
+    # `weights` is the `fish_per_age` for the number of days.
+    total = sum(weights[age] * count for age, count in age_to_count.items())
+    return total if modulus is None else total % modulus
+
+
+def count_fish(age_to_count, num_days, modulus=None):
+    """Return the number of fish after `num_days` days, exactly or modulo `modulus`.
+
+    This takes O(log(num_days)) time, so it works for millions of days (as long as
+    the exact counts, which grow exponentially, fit in memory, or with a `modulus`).
+    """
+    return total_fish(age_to_count, fish_per_age(num_days, modulus), modulus)
+
+
+def count_fish_batch(queries, modulus=None):
+    """Answer many `(age_to_count, num_days)` queries, reusing the matrix powers
+    between them and the per-age counts between queries for the same number of
+    days."""
+    weights = {}
+    counts = []
+    for age_to_count, num_days in queries:
+        if num_days not in weights:
+            weights[num_days] = fish_per_age(num_days, modulus)
+        counts.append(total_fish(age_to_count, weights[num_days], modulus))
+    return counts
+
+
+def part1(age_to_count):
+    return count_fish(age_to_count, 80)
+
+
+def part2(age_to_count):
+    return count_fish(age_to_count, 256)
+
+
+def reference_parts(age_to_count):
+    """Return the day-by-day simulation of each part, so the runner can check the
+    matrix powers against it. Both parts only simulate a few hundred days, which
+    takes about a millisecond."""
+    return {"part1": partial(simulate_days, 80), "part2": partial(simulate_days, 256)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count the lanternfish.")
+    parser.add_argument(
+        "--days",
+        type=int,
+        nargs="+",
+        help="Print the number of fish after each of these numbers of days instead "
+        "of solving parts 1 and 2.",
+    )
+    parser.add_argument(
+        "--modulus", type=int, help="Print the counts modulo this number."
+    )
+    args = parser.parse_args()
+
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        age_to_count = parse(puzzle_input.read())
+
+    if args.days:
+        queries = [(age_to_count, num_days) for num_days in args.days]
+        for num_days, count in zip(args.days, count_fish_batch(queries, args.modulus)):
+            print(f"Day {num_days}: {count}")
+    else:
+        print(f"Part 1 Solution: {part1(age_to_count)}")
+        print(f"Part 2 Solution: {part2(age_to_count)}")
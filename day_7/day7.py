@@ -1,37 +1,90 @@
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = puzzle_input.read().strip()
+from statistics import median_low
 
-initial_crab_positions = [int(x) for x in puzzle_input.split(",")]
+# The runner checks the answers against the brute-force solutions for inputs where
+# they try at most this many `(alignment position, crab)` pairs.
+BRUTE_FORCE_MAX_PAIRS = 100_000
 
-part1_fuel_amounts = []
-part2_fuel_amounts = []
+
+def parse(text):
+    return [int(x) for x in text.strip().split(",")]
 
 
 def fuel_modifier(fuel_amount):
     return fuel_amount * (fuel_amount + 1) // 2
 
 
-# Loop through all possible alignment positions
-for align_position in range(
-    min(initial_crab_positions), max(initial_crab_positions) + 1
-):
+def alignment_positions(crab_positions):
+    # Loop through all possible alignment positions
+    return range(min(crab_positions), max(crab_positions) + 1)
+
+
+def part1_brute_force(crab_positions):
     # The amount of fuel used in part 1 is the sum for all crabs of the absolute
     # value of the difference between the desired alignment position and the crab's
-    # initial position.
-    part1_fuel_spent = sum(
-        abs(align_position - crab_position) for crab_position in initial_crab_positions
+    # initial position. The solution is the amount of fuel needed for the optimal
+    # alignment position.
+    return min(
+        sum(abs(align_position - crab_position) for crab_position in crab_positions)
+        for align_position in alignment_positions(crab_positions)
     )
+
+
+def part2_brute_force(crab_positions):
     # The amount of fuel used in part 2 is the sum for all crabs of the range from 1
     # to `abs(align_position - crab_position)` (inclusive). You can write this in
     # explicit Python like so: `sum(range(1, abs(align_position - crab_position) + 1)`,
     # but using the `fuel_modifier` function is faster.
-    part2_fuel_spent = sum(
-        fuel_modifier(abs(align_position - crab_position))
-        for crab_position in initial_crab_positions
+    return min(
+        sum(
+            fuel_modifier(abs(align_position - crab_position))
+            for crab_position in crab_positions
+        )
+        for align_position in alignment_positions(crab_positions)
+    )
+
+
+def reference_parts(crab_positions):
+    """Return the brute-force solution of each part if `crab_positions` is small
+    enough for them, so the runner can check the answers against them."""
+    num_pairs = len(crab_positions) * len(alignment_positions(crab_positions))
+    if num_pairs > BRUTE_FORCE_MAX_PAIRS:
+        return {}
+    return {"part1": part1_brute_force, "part2": part2_brute_force}
+
+
+def part1(crab_positions):
+    # The sum of the distances to the alignment position is smallest at a median of
+    # the positions: moving away from it brings fewer crabs closer than it moves
+    # further away. With an even number of crabs every position between the two
+    # middle ones is optimal, so the lower one (always a crab's position) will do.
+    align_position = median_low(crab_positions)
+    return sum(abs(align_position - crab_position) for crab_position in crab_positions)
+
+
+def part2(crab_positions):
+    # The part 2 fuel is `sum((d**2 + d) / 2)` over the distances `d`. Its derivative
+    # with respect to the alignment position `x` is `n * (x - mean) + s / 2`, where
+    # `s` (the sum of the signs of the distances) is between `-n` and `n`. So the
+    # real minimum is within half a step of the mean, and since the fuel is convex
+    # the best integer position is one of the at most three integers from
+    # `floor(mean - 1/2)` to `ceil(mean + 1/2)`. These are found with integer
+    # arithmetic so they are exact however many crabs there are (unlike truncating
+    # the mean, which can miss the best position).
+    n, total = len(crab_positions), sum(crab_positions)
+    lowest = (2 * total - n) // (2 * n)
+    highest = -(-(2 * total + n) // (2 * n))
+    return min(
+        sum(
+            fuel_modifier(abs(align_position - crab_position))
+            for crab_position in crab_positions
+        )
+        for align_position in range(lowest, highest + 1)
     )
-    part1_fuel_amounts.append(part1_fuel_spent)
-    part2_fuel_amounts.append(part2_fuel_spent)
 
-# The solution is the amount of fuel needed for the optimal alignment position.
-print(f"Part 1 Solution: {min(part1_fuel_amounts)}")
-print(f"Part 2 Solution: {min(part2_fuel_amounts)}")
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        crab_positions = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(crab_positions)}")
+    print(f"Part 2 Solution: {part2(crab_positions)}")
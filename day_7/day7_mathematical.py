@@ -1,17 +1,42 @@
 # This is a mathematical approach to Advent of Code 2021 Day 7 using median and mean.
+# It only needs the standard library: importing NumPy takes far longer than summing
+# a thousand crab positions.
 
-import numpy as np
+from statistics import median
 
-with open("puzzle_input.txt", "r") as file:
-    crab_positions = np.fromfile(file, int, sep=",")
+
+def parse(text):
+    return [int(x) for x in text.strip().split(",")]
 
 
 def fuel_modifier(fuel_amount):
     return fuel_amount * (fuel_amount + 1) // 2
 
 
-part1_solution = sum(abs(crab_positions - np.median(crab_positions)))
-print(f"Part 1 Solution {int(part1_solution)}")
+def part1(crab_positions):
+    alignment_position = median(crab_positions)
+    return int(sum(abs(position - alignment_position) for position in crab_positions))
+
+
+def part2(crab_positions):
+    # The best alignment position is within half a step of the mean, so it is one of
+    # the integers from `floor(mean - 1/2)` to `ceil(mean + 1/2)` (see `day7.part2`
+    # for why). Truncating the mean can miss it, e.g. for `[12, 9, 15, 11]`.
+    n, total = len(crab_positions), sum(crab_positions)
+    lowest = (2 * total - n) // (2 * n)
+    highest = -(-(2 * total + n) // (2 * n))
+    return min(
+        sum(
+            fuel_modifier(abs(position - alignment_position))
+            for position in crab_positions
+        )
+        for alignment_position in range(lowest, highest + 1)
+    )
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as file:
+        crab_positions = parse(file.read())
 
-part2_solution = sum(fuel_modifier(abs(crab_positions - int(crab_positions.mean()))))
-print(f"Part 2 Solution: {part2_solution}")
+    print(f"Part 1 Solution {part1(crab_positions)}")
+    print(f"Part 2 Solution: {part2(crab_positions)}")
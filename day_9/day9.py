@@ -1,69 +1,230 @@
 import math
+import sys
 from collections import deque
+from pathlib import Path
 
-with open("puzzle_input.txt", "r") as puzzle_input:
-    puzzle_input = [[int(x) for x in line.strip()] for line in puzzle_input]
+# Allow running this file directly from inside `day_9` to import the shared `aoc`
+# package from the repository root.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# Parse the height grid into a `coordinates: value` dictionary of the form
-# `(x, y): value`.
-heights = {
-    (x, y): value for x, row in enumerate(puzzle_input) for y, value in enumerate(row)
-}
+from aoc.grid import Grid  # noqa: E402
 
-# Define neighboring element positions
-neighbor_positions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+# Importing NumPy takes about 110 ms. The pure Python parts together cost about
+# 5 µs per cell (51 ms for the 10,000 cells of the puzzle input, where NumPy takes
+# 1.5 ms), so NumPy only wins from roughly 20,000 cells.
+NUMPY_MIN_CELLS = 20_000
+# The NumPy versions work through the grid this many cells (whole rows) at a time,
+# so the temporary arrays stay small however large the grid is.
+NUMPY_BLOCK_CELLS = 2**22
 
-minima = {}
-for (x, y), value in heights.items():
-    # Check if all neighboring element are less than the current value. For each
-    # neighbor's position (dx, dy), modify the current value's position accordingly,
-    # then, try to get the value at that position from the `heights` dictionary. If that
-    # value cannot be found (it is an edge or corner), then return `math.inf` so the
-    # current `value` is less than the nonexistant neighbor.
-    if all(
-        value < heights.get((x + dx, y + dy), math.inf) for dx, dy in neighbor_positions
-    ):
-        minima[(x, y)] = value
 
-# The part 1 solution is the sum of all the `value + 1` at all the minimum point. This
-# is the same as the sum of all the values and the sum of the length.
-part1_solution = sum(minima.values()) + len(minima)
-print(f"Part 1 Solution: {part1_solution}")
+def parse(text):
+    # Parse the height grid into a flat `Grid` of digits. Each position is a single
+    # integer index instead of an `(x, y)` tuple.
+    return Grid.from_digits(text)
+
+
+def find_minima(heights):
+    minima = {}
+    for index, value in enumerate(heights.cells):
+        # Check if all neighboring element are less than the current value. Positions
+        # on an edge or corner simply have fewer neighbors, which is the same as
+        # treating the nonexistant neighbors as infinitely high.
+        if all(value < heights[neighbor] for neighbor in heights.neighbors4(index)):
+            minima[index] = value
+    return minima
+
+
+def row_blocks(heights):
+    """Yield the starting row of each block of rows that `NUMPY_BLOCK_CELLS` allows,
+    along with the `(height, width)` NumPy view of `heights`."""
+    grid = heights.to_numpy()
+    block_rows = max(1, NUMPY_BLOCK_CELLS // heights.width)
+    for start in range(0, heights.height, block_rows):
+        yield grid, start, min(start + block_rows, heights.height)
+
+
+def low_point_heights_numpy(heights):
+    """The same as `find_minima(heights).values()`, but found by comparing shifted
+    copies of the grid with NumPy.
+
+    Returns:
+        ndarray: The height of each low point, in order of position.
+    """
+    import numpy as np
+
+    low_heights = []
+    for grid, start, end in row_blocks(heights):
+        # The block with the row above and below it, padded with heights of 10 on the
+        # sides (and above and below at the edges of the grid), so that every cell in
+        # the block has four neighbors and cells outside the grid are never lower.
+        block = grid[max(start - 1, 0) : end + 1]
+        padding = ((int(start == 0), int(end == heights.height)), (1, 1))
+        padded = np.pad(block, padding, constant_values=10)
+        center = padded[1:-1, 1:-1]
+        is_low = (
+            (center < padded[:-2, 1:-1])
+            & (center < padded[2:, 1:-1])
+            & (center < padded[1:-1, :-2])
+            & (center < padded[1:-1, 2:])
+        )
+        low_heights.append(center[is_low])
+    return np.concatenate(low_heights)
+
+
+def part1(heights):
+    if len(heights) >= NUMPY_MIN_CELLS:
+        low_heights = low_point_heights_numpy(heights)
+        return int(low_heights.sum()) + len(low_heights)
+    minima = find_minima(heights)
+    # The part 1 solution is the sum of all the `value + 1` at all the minimum point.
+    # This is the same as the sum of all the values and the sum of the length.
+    return sum(minima.values()) + len(minima)
 
 
 # Implementation of Breadth First Search (BFS) to find basins.
-def bfs(graph, node):
-    visited = set()
+def bfs(graph, node, visited):
     # `deque` is "a list-like container with fast appends and pops on either end."
     queue = deque()
-    visited.add(node)
+    visited[node] = 1
     queue.append(node)
+    basin_size = 1
 
     while queue:
-        # `queue` holds the key values from the `heights` dictionary.
-        x, y = queue.popleft()
-
-        # Define neighboring positions from the current position.
-        neighbors = [(x + dx, y + dy) for dx, dy in neighbor_positions]
-        for neighbor in neighbors:
-            # Only check the neighbor is it hasn't been visited and if it is a valid
-            # neighbor that is in the `graph`/`heights`.
-            if neighbor not in visited and neighbor in graph:
-                height = graph[neighbor]
-                # A height of 9 cannot be included per challenge description.
-                if height < 9:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-
-    return visited
-
-
-# Conduct a BFS on each minimum point in the `heights` grid. `bfs()` returns
-# a list of coordinates that are part of the basin formed at `node`.
-basins = [bfs(heights, node) for node in minima.keys()]
-# Sort the basins by number of points, as per the challenge description.
-basins_lengths = sorted(len(basin) for basin in basins)
-# Multiple the lengths of the largest basins, which is the challenge answer.
-part2_solution = math.prod(basins_lengths[-3:])
-
-print(f"Part 2 Solution: {part2_solution}")
+        # `queue` holds the indexes of positions in the `graph`/`heights` grid.
+        position = queue.popleft()
+
+        # Only check neighbors that are inside the grid and have not been visited.
+        for neighbor in graph.neighbors4(position):
+            # A height of 9 cannot be included per challenge description.
+            if not visited[neighbor] and graph[neighbor] < 9:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+                basin_size += 1
+
+    return basin_size
+
+
+def connected_components(num_nodes, first, second):
+    """Label the connected components of the graph with `num_nodes` nodes and an edge
+    between each `first[i]` and `second[i]`, with NumPy.
+
+    This is a vectorized union-find: every node points at a node with a smaller
+    index (initially itself), each round hooks the roots at both ends of every edge
+    onto the smaller one, and pointer jumping then flattens the trees. A handful of
+    rounds joins components of any shape, where spreading the smallest label between
+    neighbors would take as many rounds as the longest path in a component.
+
+    Returns:
+        ndarray: The smallest node index in the component of each node.
+    """
+    import numpy as np
+
+    labels = np.arange(num_nodes, dtype=first.dtype)
+    while True:
+        first_labels, second_labels = labels[first], labels[second]
+        # Edges whose ends are already in the same tree are never needed again.
+        unjoined = first_labels != second_labels
+        if not unjoined.any():
+            return labels
+        first, second = first[unjoined], second[unjoined]
+        first_labels, second_labels = first_labels[unjoined], second_labels[unjoined]
+        smaller = np.minimum(first_labels, second_labels)
+        np.minimum.at(labels, first_labels, smaller)
+        np.minimum.at(labels, second_labels, smaller)
+        while True:
+            parents = labels[labels]
+            if np.array_equal(parents, labels):
+                break
+            labels = parents
+
+
+def vertical_edges(upper, lower):
+    """Return the pairs of runs that touch between the rows of run numbers `upper`
+    and the rows below them, `lower` (`-1` for a 9)."""
+    touching = (upper >= 0) & (lower >= 0)
+    # Cells that touch the same pair of runs as their left neighbor give the same
+    # edge, so only keep the first cell of each pair.
+    repeated = touching[:, :-1] & (upper[:, 1:] == upper[:, :-1])
+    repeated &= lower[:, 1:] == lower[:, :-1]
+    touching[:, 1:] &= ~repeated
+    return upper[touching], lower[touching]
+
+
+def basin_sizes_numpy(heights):
+    """Return the size of every basin, labelling all of them at once with NumPy
+    instead of searching from each low point.
+
+    The basins are the connected regions of heights below 9. Each row's cells are
+    first grouped into horizontal runs of basin cells, which are connected by
+    definition, and then the runs that touch a run in the next row are joined with
+    `connected_components`. This only stores a few numbers per run.
+
+    Like the challenge, this assumes every basin has exactly one low point.
+
+    Returns:
+        ndarray: The number of cells in each basin.
+    """
+    import numpy as np
+
+    # There are fewer runs than cells, so 32-bit run numbers are almost always enough.
+    run_dtype = np.int32 if len(heights) < 2**31 else np.int64
+    run_lengths, edges = [], []
+    num_runs = 0
+    # The run of each cell in the last row of the previous block (`-1` for a 9).
+    previous_runs = None
+    for grid, start, end in row_blocks(heights):
+        in_basin = grid[start:end] < 9
+        # A run starts at each basin cell whose left neighbor is a 9 or off the grid,
+        # and ends at each basin cell whose right neighbor is.
+        run_starts = in_basin.copy()
+        run_starts[:, 1:] &= ~in_basin[:, :-1]
+        run_ends = in_basin.copy()
+        run_ends[:, :-1] &= ~in_basin[:, 1:]
+        run_lengths.append(np.flatnonzero(run_ends) - np.flatnonzero(run_starts) + 1)
+        runs = np.cumsum(run_starts, axis=None, dtype=run_dtype)
+        runs = runs.reshape(in_basin.shape)
+        runs += num_runs - 1
+        runs[~in_basin] = -1
+        num_runs += len(run_lengths[-1])
+
+        if previous_runs is not None:
+            edges.append(vertical_edges(previous_runs, runs[:1]))
+        edges.append(vertical_edges(runs[:-1], runs[1:]))
+        previous_runs = runs[-1:]
+
+    if not num_runs:
+        return np.zeros(0, dtype=np.int64)
+    first = np.concatenate([upper for upper, _ in edges])
+    second = np.concatenate([lower for _, lower in edges])
+    labels = connected_components(num_runs, first, second)
+    sizes = np.bincount(labels, weights=np.concatenate(run_lengths))
+    return sizes[sizes > 0].astype(np.int64)
+
+
+def part2(heights):
+    if len(heights) >= NUMPY_MIN_CELLS:
+        import numpy as np
+
+        sizes = np.sort(basin_sizes_numpy(heights))
+        return math.prod(sizes[-3:].tolist())
+
+    # Mark visited positions in a `bytearray` with one byte per position instead of
+    # a `set` of positions. Every basin has a single low point so the basins never
+    # share positions and one `visited` array can be used for all of them.
+    visited = bytearray(len(heights))
+    # Conduct a BFS on each minimum point in the `heights` grid. `bfs()` returns
+    # the number of positions that are part of the basin formed at `node`.
+    basins_lengths = sorted(
+        bfs(heights, node, visited) for node in find_minima(heights).keys()
+    )
+    # Multiple the lengths of the largest basins, which is the challenge answer.
+    return math.prod(basins_lengths[-3:])
+
+
+if __name__ == "__main__":
+    with open("puzzle_input.txt", "r") as puzzle_input:
+        heights = parse(puzzle_input.read())
+
+    print(f"Part 1 Solution: {part1(heights)}")
+    print(f"Part 2 Solution: {part2(heights)}")